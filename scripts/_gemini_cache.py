@@ -0,0 +1,86 @@
+"""Cache de contexto nativo do Gemini (``cachedContents``) para instruções fixas.
+
+As instruções de cada subcomando são idênticas entre PRs; registrá-las uma vez como
+``CachedContent`` faz com que chamadas seguintes paguem apenas o sufixo dinâmico (diff, título,
+corpo). O nome do cache criado é persistido em ``.cache/gemini/context_cache.json`` com a data de
+expiração, para ser reaproveitado por execuções seguintes.
+
+A API recusa conteúdos abaixo de um mínimo de tokens. Instruções com menos caracteres que esse
+mínimo (um token tem ao menos um caractere) nem chegam a consultar a API; as demais passam por
+``count_tokens`` antes de ``CachedContent.create``. Abaixo do mínimo (ou em qualquer falha) o modelo
+é criado com ``system_instruction`` comum e a decisão é lembrada até o fim do TTL.
+
+Variáveis de ambiente:
+  GEMINI_CONTEXT_CACHE_TTL         validade do cache de contexto em segundos (padrão: 3600)
+  GEMINI_CONTEXT_CACHE_MIN_TOKENS  mínimo de tokens aceito pela API (padrão: 32768, Gemini 1.5)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+STATE_FILE = Path(os.getenv("LLM_CACHE_DIR", ".cache/gemini")) / "context_cache.json"
+CONTEXT_CACHE_TTL = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL", "3600"))
+MIN_CACHE_TOKENS = int(os.getenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", "32768"))
+# Margem para não usar um cache prestes a expirar durante a chamada
+_EXPIRY_MARGIN = 60
+
+
+def _load_state() -> dict:
+    try:
+        data = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_state(state: dict) -> None:
+    try:
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        STATE_FILE.write_text(json.dumps(state), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _enough_tokens(genai, model_name: str, instructions: str) -> bool:  # noqa: ANN001
+    try:
+        tokens = genai.GenerativeModel(model_name).count_tokens(instructions).total_tokens
+    except Exception:
+        return False
+    return tokens >= MIN_CACHE_TOKENS
+
+
+def model_with_instructions(genai, model_name: str, instructions: str):  # noqa: ANN001, ANN201
+    """Retorna um ``GenerativeModel`` cujas instruções fixas vêm do cache de contexto, se possível."""
+    if len(instructions) < MIN_CACHE_TOKENS:  # caso comum: sem estado em disco nem chamada à API
+        return genai.GenerativeModel(model_name, system_instruction=instructions)
+    key = hashlib.sha256(f"{model_name}\0{instructions}".encode()).hexdigest()
+    now = time.time()
+    state = {k: v for k, v in _load_state().items() if v.get("expires", 0) > now + _EXPIRY_MARGIN}
+    entry = state.get(key)
+    if entry and entry.get("name"):
+        try:
+            return genai.GenerativeModel.from_cached_content(cached_content=entry["name"])
+        except Exception:
+            entry = None
+    if entry is None and not _enough_tokens(genai, model_name, instructions):
+        state[key] = {"name": None, "expires": now + CONTEXT_CACHE_TTL}
+        _save_state(state)
+    elif entry is None:
+        try:
+            cached = genai.caching.CachedContent.create(
+                model=model_name,
+                system_instruction=instructions,
+                ttl=f"{CONTEXT_CACHE_TTL}s",
+            )
+            state[key] = {"name": cached.name, "expires": now + CONTEXT_CACHE_TTL}
+            _save_state(state)
+            return genai.GenerativeModel.from_cached_content(cached_content=cached)
+        except Exception:
+            state[key] = {"name": None, "expires": now + CONTEXT_CACHE_TTL}
+            _save_state(state)
+    return genai.GenerativeModel(model_name, system_instruction=instructions)
@@ -0,0 +1,19 @@
+"""Import sob demanda do SDK ``google.generativeai``, compartilhado pelos scripts Gemini.
+
+O SDK carrega gRPC/protobuf e custa centenas de ms; os scripts só chamam ``load_genai`` depois de
+confirmar ``GEMINI_API_KEY``, de modo que execuções sem chave não pagam esse custo.
+"""
+
+from __future__ import annotations
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def load_genai():  # noqa: ANN201
+    """Retorna o módulo ``google.generativeai`` ou None se a biblioteca não estiver instalada."""
+    try:
+        import google.generativeai as genai  # type: ignore
+    except ImportError:  # pragma: no cover
+        return None
+    return genai
@@ -0,0 +1,27 @@
+"""Sessão HTTP compartilhada pelos scripts que falam com a API do GitHub.
+
+Uma única ``requests.Session`` reaproveita conexões TCP/TLS entre chamadas e repete
+automaticamente requisições idempotentes que falham com 429/5xx.
+"""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_session() -> requests.Session:
+    # raise_on_status=False: esgotadas as tentativas, devolve a última resposta em vez de levantar
+    # RetryError; os chamadores já tratam status_code e degradam sem derrubar o processo.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/vnd.github+json"})
+    return session
@@ -0,0 +1,254 @@
+"""Cache de respostas compartilhado pelos scripts Gemini.
+
+A primeira camada é exata: a resposta fica em um arquivo nomeado por
+``sha256(modelo, namespace, prompt)`` e reexecuções com a mesma entrada não chamam a API.
+
+Na segunda camada (semântica), prompts são convertidos em embeddings (endpoint de embeddings do
+próprio Gemini) e comparados por similaridade de cosseno com respostas já armazenadas em SQLite. Se
+a similaridade com uma entrada recente do mesmo ``namespace`` atingir o limiar, a resposta
+armazenada é reutilizada e nenhuma chamada de geração é feita. Essa camada é opcional
+(``semantic=True``) e serve só a texto livre (review, summary): respostas estruturadas citam
+arquivos/linhas do pedido original e, reaproveitadas para um patch apenas parecido, apontariam para
+caminhos fora do diff. Pedidos JSON/schema usam apenas a camada exata, assim como prompts acima de
+``LLM_CACHE_EMBED_MAX_CHARS``: o modelo de embeddings aceita ~2048 tokens e truncaria o prompt,
+tornando "iguais" dois diffs que só diferem depois do corte.
+
+Variáveis de ambiente:
+  LLM_CACHE_DIR              diretório do cache (padrão: .cache/gemini)
+  LLM_CACHE_TTL              validade das entradas (ambas as camadas) em segundos (padrão: 3600)
+  LLM_CACHE_THRESHOLD        similaridade mínima para reutilizar resposta (padrão: 0.92)
+  LLM_CACHE_EMBED_MODEL      modelo de embeddings (padrão: models/text-embedding-004)
+  LLM_CACHE_EMBED_MAX_CHARS  maior prompt usado na camada semântica (padrão: 6000, ~2048 tokens)
+
+Entradas exatas expiradas são apagadas por mtime na primeira escrita de cada processo.
+
+Qualquer falha do cache (embedding, SQLite) apenas desativa o atalho; a geração segue normalmente.
+
+Em caso de miss a resposta é consumida em streaming; pedidos que esperam JSON podem encerrar o
+streaming assim que o primeiro objeto completo chega.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+
+# Mesmo scanner usado pelo pacote (instalado em todos os workflows que rodam estes scripts).
+from python_actions_automation.ai.core import _extract_json_object
+
+CACHE_DIR = Path(os.getenv("LLM_CACHE_DIR", ".cache/gemini"))
+DEFAULT_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))
+DEFAULT_THRESHOLD = float(os.getenv("LLM_CACHE_THRESHOLD", "0.92"))
+EMBED_MODEL = os.getenv("LLM_CACHE_EMBED_MODEL", "models/text-embedding-004")
+# Código/diff rende ~3 caracteres por token; acima disso o embedding veria só parte do prompt
+EMBED_MAX_CHARS = int(os.getenv("LLM_CACHE_EMBED_MAX_CHARS", "6000"))
+
+
+def _model_name(model) -> str:  # noqa: ANN001
+    return str(getattr(model, "model_name", ""))
+
+
+def _exact_get(key: str, ttl: int) -> str | None:
+    path = CACHE_DIR / "exact" / key
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _exact_put(key: str, text: str) -> None:
+    path = CACHE_DIR / "exact" / key
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    except OSError:
+        pass
+
+
+_PRUNED = threading.Event()
+
+
+def prune_exact(ttl: int = DEFAULT_TTL) -> None:
+    """Remove as entradas exatas com mtime mais antigo que ``ttl`` (uma vez por processo)."""
+    if _PRUNED.is_set():
+        return
+    _PRUNED.set()
+    cutoff = time.time() - ttl
+    try:
+        entries = list((CACHE_DIR / "exact").iterdir())
+    except OSError:
+        return
+    for path in entries:
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _chunk_text(chunk) -> str:  # noqa: ANN001
+    try:
+        return chunk.text or ""
+    except ValueError:  # chunk sem partes de texto (ex.: apenas finish_reason)
+        return ""
+
+
+def _stream_text(model, prompt: str, generation_config: dict | None, until_json: bool) -> str:  # noqa: ANN001
+    buf = ""
+    for chunk in model.generate_content(prompt, generation_config=generation_config, stream=True):
+        buf += _chunk_text(chunk)
+        if until_json and buf.rstrip().endswith("}"):
+            obj = _extract_json_object(buf)
+            if obj is not None:
+                try:
+                    json.loads(obj)
+                except ValueError:
+                    continue
+                break
+    return buf
+
+
+class SemanticCache:
+    """Armazena ``(chave, embedding, resposta)`` e busca a resposta mais similar."""
+
+    def __init__(
+        self,
+        path: Path,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl: int = DEFAULT_TTL,
+        embed_model: str = EMBED_MODEL,
+    ) -> None:
+        self.path = path
+        self.threshold = threshold
+        self.ttl = ttl
+        self.embed_model = embed_model
+        self._conn: sqlite3.Connection | None = None
+        # Chamadas concorrentes (ex.: line-review por arquivo) compartilham a conexão
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, namespace TEXT, embedding BLOB, "
+                "response TEXT, created_at REAL)"
+            )
+        return self._conn
+
+    def embed(self, text: str) -> array | None:
+        """Retorna o embedding normalizado (norma 1) ou None se indisponível."""
+        try:
+            import google.generativeai as genai  # type: ignore
+
+            values = genai.embed_content(model=self.embed_model, content=text)["embedding"]
+        except Exception:
+            return None
+        norm = math.sqrt(sum(v * v for v in values))
+        if not norm:
+            return None
+        return array("f", (v / norm for v in values))
+
+    def lookup(self, namespace: str, embedding: array, ttl: int | None = None) -> str | None:
+        ttl = self.ttl if ttl is None else ttl
+        try:
+            with self._lock:
+                cursor = self._db().execute(
+                    "SELECT embedding, response FROM entries WHERE namespace = ? AND created_at >= ?",
+                    (namespace, time.time() - ttl),
+                )
+                rows = cursor.fetchall()
+            best_score, best_response = -1.0, None
+            for blob, response in rows:
+                stored = array("f")
+                stored.frombytes(blob)
+                if len(stored) != len(embedding):
+                    continue
+                # Vetores já normalizados: o produto escalar é o cosseno.
+                score = sum(a * b for a, b in zip(embedding, stored, strict=True))
+                if score > best_score:
+                    best_score, best_response = score, response
+        except sqlite3.Error:
+            return None
+        return best_response if best_score >= self.threshold else None
+
+    def store(self, key: str, namespace: str, embedding: array, response: str) -> None:
+        try:
+            with self._lock, self._db() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, namespace, embedding.tobytes(), response, time.time()),
+                )
+                db.execute("DELETE FROM entries WHERE created_at < ?", (time.time() - self.ttl,))
+        except sqlite3.Error:
+            pass
+
+
+_CACHE: SemanticCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def _default_cache() -> SemanticCache:
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = SemanticCache(CACHE_DIR / "semantic.sqlite3")
+    return _CACHE
+
+
+def cached_generate(  # noqa: ANN001
+    model,
+    prompt: str,
+    *,
+    namespace: str = "",
+    system: str = "",
+    ttl: int | None = None,
+    generation_config: dict | None = None,
+    until_json: bool = False,
+    semantic: bool = False,
+) -> str:
+    """Equivalente a ``model.generate_content(prompt).text`` com cache exato e semântico.
+
+    ``namespace`` separa tipos de pedido (review, summary, ...) que compartilham o mesmo diff e,
+    portanto, teriam embeddings parecidos sem serem intercambiáveis. ``system`` é a instrução
+    fixa já embutida no modelo (system instruction / cache de contexto); ela não vai no prompt,
+    mas precisa fazer parte da chave. ``generation_config`` é repassado ao modelo e também entra na
+    chave; com ``until_json`` o streaming para no primeiro objeto JSON completo. ``semantic``
+    habilita a camada semântica, ignorada sempre que há ``generation_config`` (respostas
+    estruturadas) e para prompts maiores que ``EMBED_MAX_CHARS``. Exceções da geração são
+    propagadas para o chamador.
+    """
+    cache = _default_cache()
+    ttl = cache.ttl if ttl is None else ttl
+    system_hash = hashlib.sha256(system.encode()).hexdigest() if system else ""
+    config = json.dumps(generation_config, sort_keys=True) if generation_config else ""
+    scope = f"{_model_name(model)}\0{namespace}\0{system_hash}\0{config}"
+    key = hashlib.sha256(f"{scope}\0{prompt}".encode()).hexdigest()
+    exact = _exact_get(key, ttl)
+    if exact is not None:
+        return exact
+    use_semantic = (
+        semantic and not generation_config and not until_json and len(prompt) <= EMBED_MAX_CHARS
+    )
+    embedding = cache.embed(prompt) if use_semantic else None
+    if embedding is not None:
+        hit = cache.lookup(scope, embedding, ttl)
+        if hit is not None:
+            return hit
+    text = _stream_text(model, prompt, generation_config, until_json)
+    if text:
+        _exact_put(key, text)
+        prune_exact(cache.ttl)
+        if embedding is not None:
+            cache.store(key, scope, embedding, text)
+    return text
@@ -3,81 +3,204 @@
 
 Simplificado em relação a soluções mais complexas: extrai blocos cercados por ```python ou ```bash,
 formata usando ruff (python) ou prettier (bash) e reescreve o arquivo.
+
+Os blocos de todos os arquivos são gravados em um diretório temporário e cada formatador é
+invocado uma única vez sobre o lote, evitando um subprocesso por bloco. Extração e reescrita dos
+arquivos são distribuídas entre processos.
 """
 
 from __future__ import annotations
 
-import re
+import functools
+import hashlib
+import os
 import subprocess
 import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-CODE_BLOCK_RE = re.compile(r"```(python|bash|sh)\n(.*?)```", re.DOTALL)
-
-
-def format_python(code: str) -> str:
-    with tempfile.NamedTemporaryFile("w+", suffix=".py", delete=False) as tmp:
-        tmp.write(code)
-        tmp.flush()
-        try:
-            subprocess.run(["ruff", "format", tmp.name], check=True, capture_output=True)
-        except Exception:
-            return code
-        tmp.seek(0)
-        return tmp.read().rstrip("\n")
-
-
-def format_bash(code: str) -> str:
-    with tempfile.NamedTemporaryFile("w+", suffix=".sh", delete=False) as tmp:
-        tmp.write(code)
-        tmp.flush()
+SUFFIXES = {"python": ".py", "bash": ".sh", "sh": ".sh"}
+BATCH_COMMANDS = {
+    ".py": ["ruff", "format"],
+    ".sh": ["npx", "prettier", "--plugin=@prettier/plugin-sh", "--parser=sh", "--write"],
+}
+IGNORE_DIRS = {".git", "dist", "build", "node_modules", ".venv", "__pycache__", ".cache"}
+
+# Resultados já formatados, indexados pelo conteúdo do bloco e pela versão/configuração do
+# formatador (atualizar ruff/prettier ou mudar a config invalida as entradas); podados por mtime.
+CACHE_DIR = Path(".cache/format_markdown")
+CACHE_MAX_ENTRIES = 2000
+VERSION_COMMANDS = {".py": ["ruff", "--version"], ".sh": ["npx", "prettier", "--version"]}
+CONFIG_FILES = {
+    ".py": ("pyproject.toml", "ruff.toml", ".ruff.toml"),
+    ".sh": (".prettierrc", ".prettierrc.json", ".prettierrc.yaml", ".prettierrc.yml"),
+}
+
+
+@functools.cache
+def _formatter_fingerprint(suffix: str) -> str:
+    parts = []
+    try:
+        result = subprocess.run(VERSION_COMMANDS[suffix], capture_output=True, text=True)
+        parts.append(result.stdout.strip())
+    except OSError:
+        parts.append("")
+    for name in CONFIG_FILES[suffix]:
         try:
-            subprocess.run(
-                [
-                    "npx",
-                    "prettier",
-                    "--plugin=@prettier/plugin-sh",
-                    "--parser=sh",
-                    tmp.name,
-                    "--write",
-                ],
-                check=True,
-                capture_output=True,
-            )
-        except Exception:
-            return code
-        tmp.seek(0)
-        return tmp.read().rstrip("\n")
-
-
-FORMATTERS = {"python": format_python, "bash": format_bash, "sh": format_bash}
-
-
-def process_file(path: Path) -> bool:
-    text = path.read_text(encoding="utf-8")
+            parts.append(Path(name).read_text(encoding="utf-8"))
+        except OSError:
+            parts.append("")
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _cache_path(suffix: str, code: str) -> Path:
+    key = f"{suffix}\0{_formatter_fingerprint(suffix)}\0{code}"
+    return CACHE_DIR / hashlib.sha256(key.encode()).hexdigest()
+
+
+def cache_get(suffix: str, code: str) -> str | None:
+    path = _cache_path(suffix, code)
+    try:
+        formatted = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    try:
+        path.touch()  # mtime marca o uso recente para prune_cache
+    except OSError:
+        pass
+    return formatted
+
+
+def cache_put(suffix: str, code: str, formatted: str) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(suffix, code).write_text(formatted, encoding="utf-8")
+    except OSError:
+        pass
+
+
+def prune_cache(max_entries: int = CACHE_MAX_ENTRIES) -> None:
+    """Remove as entradas menos usadas recentemente quando o cache excede ``max_entries``."""
+    try:
+        entries = sorted(CACHE_DIR.iterdir(), key=lambda p: p.stat().st_mtime)
+    except OSError:
+        return
+    for path in entries[: max(0, len(entries) - max_entries)]:
+        path.unlink(missing_ok=True)
+
+
+def iter_blocks(lines: list[str]) -> Iterator[tuple[int, int, str]]:
+    """Percorre as linhas uma única vez e produz ``(abertura, fechamento, lang)`` dos blocos.
+
+    Cercas de outras linguagens são puladas inteiras; uma cerca sem fechamento encerra a busca.
+    """
+    i, n = 0, len(lines)
+    while i < n:
+        if not lines[i].startswith("```"):
+            i += 1
+            continue
+        lang = lines[i][3:].strip()
+        j = i + 1
+        while j < n and lines[j].strip() != "```":
+            j += 1
+        if j == n:
+            return
+        if lang in SUFFIXES:
+            yield i, j, lang
+        i = j + 1
+
+
+def extract_blocks(path: Path) -> list[tuple[str, str]]:
+    """Retorna os blocos ``(lang, code)`` de um arquivo na ordem em que aparecem."""
+    lines = path.read_text(encoding="utf-8").split("\n")
+    return [
+        (lang, "\n".join(lines[start + 1 : end]) + "\n") for start, end, lang in iter_blocks(lines)
+    ]
+
+
+def format_batch(blocks: list[tuple[str, str]]) -> list[str]:
+    """Formata todos os blocos com uma única chamada por formatador.
+
+    Blocos presentes no cache não são enviados ao formatador. Blocos que o formatador não
+    consegue processar são devolvidos sem alteração.
+    """
+    results = [code.rstrip("\n") for _, code in blocks]
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        entries: dict[str, list[tuple[int, Path]]] = {}
+        for i, (lang, code) in enumerate(blocks):
+            suffix = SUFFIXES[lang]
+            cached = cache_get(suffix, code)
+            if cached is not None:
+                results[i] = cached
+                continue
+            target_dir = root / suffix.lstrip(".")
+            target_dir.mkdir(exist_ok=True)
+            target = target_dir / f"block_{i:06d}{suffix}"
+            target.write_text(code, encoding="utf-8")
+            entries.setdefault(suffix, []).append((i, target))
+        for suffix, files in entries.items():
+            target_dir = root / suffix.lstrip(".")
+            try:
+                proc = subprocess.run(
+                    [*BATCH_COMMANDS[suffix], str(target_dir)], check=False, capture_output=True
+                )
+            except Exception:
+                continue
+            for i, target in files:
+                results[i] = target.read_text(encoding="utf-8").rstrip("\n")
+                # Saída idêntica à entrada só é confiável se o formatador rodou sem erros.
+                if proc.returncode == 0 or results[i] != blocks[i][1].rstrip("\n"):
+                    cache_put(suffix, blocks[i][1], results[i])
+    prune_cache()
+    return results
+
+
+def splice_blocks(path: Path, formatted: list[str]) -> bool:
+    """Reescreve ``path`` substituindo cada bloco pelo resultado formatado correspondente."""
+    lines = path.read_text(encoding="utf-8").split("\n")
+    out: list[str] = []
+    last = 0
     changed = False
-
-    def repl(match):
-        nonlocal changed
-        lang, code = match.group(1), match.group(2)
-        formatted = FORMATTERS.get(lang, lambda x: x)(code)
-        if formatted != code.rstrip("\n"):
+    for (start, end, _), new_code in zip(iter_blocks(lines), formatted, strict=True):
+        if new_code != "\n".join(lines[start + 1 : end]).rstrip("\n"):
             changed = True
-        return f"```{lang}\n{formatted}\n```"
-
-    new_text = CODE_BLOCK_RE.sub(repl, text)
+        out.extend(lines[last : start + 1])
+        out.extend(new_code.split("\n") if new_code else [])
+        last = end
+    out.extend(lines[last:])
     if changed:
-        path.write_text(new_text, encoding="utf-8")
+        path.write_text("\n".join(out), encoding="utf-8")
     return changed
 
 
+def iter_markdown_files(root: Path) -> Iterator[Path]:
+    """Percorre ``root`` sem descer nos diretórios de ``IGNORE_DIRS``."""
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+        for name in files:
+            if name.endswith(".md"):
+                yield Path(dirpath) / name
+
+
 def main():  # noqa: D401
-    total = updated = 0
-    for md in Path.cwd().rglob("*.md"):
-        total += 1
-        if process_file(md):
-            updated += 1
-    print(f"Markdown analisados: {total}, atualizados: {updated}")
+    paths = list(iter_markdown_files(Path.cwd()))
+    # Leitura/extração e reescrita são independentes por arquivo e rodam em paralelo;
+    # apenas a chamada aos formatadores acontece no processo principal.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        per_file = list(ex.map(extract_blocks, paths, chunksize=8))
+        formatted = format_batch([block for blocks in per_file for block in blocks])
+        chunks = []
+        offset = 0
+        for blocks in per_file:
+            chunks.append(formatted[offset : offset + len(blocks)])
+            offset += len(blocks)
+        pending = [(md, chunk) for md, chunk in zip(paths, chunks, strict=True) if chunk]
+        updated = sum(
+            ex.map(splice_blocks, [md for md, _ in pending], [c for _, c in pending], chunksize=8)
+        )
+    print(f"Markdown analisados: {len(paths)}, atualizados: {updated}")
 
 
 if __name__ == "__main__":  # pragma: no cover
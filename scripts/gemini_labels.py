@@ -8,18 +8,20 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import sys
 
-import requests
-
-try:  # pragma: no cover - ambiente CI
-    import google.generativeai as genai  # type: ignore
-except ImportError:  # pragma: no cover
-    genai = None  # type: ignore
+from _genai import load_genai
+from _http import build_session
+from _llm_cache import cached_generate
 
 COMMENT_HEADER = "<!-- gemini-ai-labels -->"
+LABEL_SCHEMA = {
+    "type": "object",
+    "properties": {"labels": {"type": "array", "items": {"type": "string"}}},
+    "required": ["labels"],
+}
 DEFAULT_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+SESSION = build_session()
 
 
 def read_file(path: str) -> str:
@@ -39,8 +41,7 @@ def build_prompt(title: str, body: str, diff: str, allowed: set[str], max_labels
     allowed_list = ", ".join(sorted(allowed)) or "(nenhuma definida)"
     return (
         "Você é um assistente que classifica Pull Requests de um projeto Python. "
-        "Retorne SOMENTE um JSON com a chave 'labels' contendo uma lista (até {max_labels}) "
-        "de labels contidas neste conjunto permitido: {allowed}. "
+        "Escolha até {max_labels} labels contidas neste conjunto permitido: {allowed}. "
         "Prefira diversidade e relevância; não invente labels fora da lista.\n\n"
         f"TÍTULO: {title}\n\nDESCRIÇÃO:\n{body[:3000]}\n\nDIFF:\n{diff[:8000]}\n"
     ).format(max_labels=max_labels, allowed=allowed_list)
@@ -48,7 +49,8 @@ def build_prompt(title: str, body: str, diff: str, allowed: set[str], max_labels
 
 def configure_model():  # noqa: ANN201
     api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or not genai:
+    genai = load_genai() if api_key else None
+    if genai is None:
         print("[labels] GEMINI_API_KEY ausente ou lib indisponível; abortando silenciosamente.")
         return None
     genai.configure(api_key=api_key)
@@ -60,13 +62,10 @@ def configure_model():  # noqa: ANN201
 
 
 def extract_labels(text: str, allowed: set[str], max_labels: int) -> list[str]:
-    # Tenta encontrar bloco JSON
-    match = re.search(r"\{.*\}", text, flags=re.DOTALL)
-    if not match:
-        return []
+    # Resposta restrita a LABEL_SCHEMA: o texto inteiro é o objeto JSON
     try:
-        data = json.loads(match.group(0))
-        labels = data.get("labels", [])
+        data = json.loads(text)
+        labels = data.get("labels", []) if isinstance(data, dict) else []
         if not isinstance(labels, list):
             return []
         norm = []
@@ -89,7 +88,7 @@ def apply_labels(repo: str, pr_number: int, labels: list[str], token: str) -> No
         return
     url = f"https://api.github.com/repos/{repo}/issues/{pr_number}/labels"
     headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
-    r = requests.post(url, headers=headers, data=json.dumps({"labels": labels}), timeout=30)
+    r = SESSION.post(url, headers=headers, data=json.dumps({"labels": labels}), timeout=30)
     if r.status_code not in (200, 201):
         print(f"[labels] Falha ao aplicar labels: {r.status_code} -> {r.text[:300]}")
     else:
@@ -100,7 +99,7 @@ def comment_result(repo: str, pr_number: int, labels: list[str], token: str) ->
     url = f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments"
     headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
     body = f"{COMMENT_HEADER}\nLabels sugeridas/aplicadas: {', '.join(labels) if labels else '(nenhuma)'}"
-    r = requests.post(url, headers=headers, data=json.dumps({"body": body}), timeout=30)
+    r = SESSION.post(url, headers=headers, data=json.dumps({"body": body}), timeout=30)
     if r.status_code not in (200, 201):
         print(f"[labels] Falha ao comentar labels: {r.status_code}")
 
@@ -126,8 +125,15 @@ def main() -> int:
         return 0
 
     try:
-        response = model.generate_content(prompt)
-        raw_text = getattr(response, "text", "")
+        raw_text = cached_generate(
+            model,
+            prompt,
+            namespace="labels",
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": LABEL_SCHEMA,
+            },
+        )
     except Exception as e:  # pragma: no cover
         print(f"[labels] Error na geração: {e}")
         return 0
@@ -10,15 +10,13 @@ import json
 import os
 import sys
 
-import requests
-
-try:  # pragma: no cover
-    import google.generativeai as genai  # type: ignore
-except ImportError:  # pragma: no cover
-    genai = None  # type: ignore
+from _genai import load_genai
+from _http import build_session
+from _llm_cache import cached_generate
 
 HEADER = "<!-- gemini-pr-summary -->"
 MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+SESSION = build_session()
 
 
 def load_diff(path: str) -> str:
@@ -31,7 +29,8 @@ def load_diff(path: str) -> str:
 
 def generate_summary(diff: str) -> str:
     api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or not genai:
+    genai = load_genai() if api_key else None
+    if genai is None:
         return "(Resumo indisponível: GEMINI_API_KEY ausente)"
     genai.configure(api_key=api_key)
     model = genai.GenerativeModel(MODEL)
@@ -41,8 +40,7 @@ def generate_summary(diff: str) -> str:
         "Texto em Português. Seja sucinto.\n\nDIFF:\n" + diff[:20000]
     )
     try:
-        resp = model.generate_content(prompt)
-        text = getattr(resp, "text", "").strip()
+        text = cached_generate(model, prompt, namespace="summary", semantic=True).strip()
         return text or "(sem conteúdo)"
     except Exception as e:  # pragma: no cover
         return f"(Falha ao gerar resumo: {e})"
@@ -53,7 +51,7 @@ def post_comment(summary: str, repo: str, pr_number: str, token: str):
     headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
 
     # Procurar comentário existente
-    existing = requests.get(url, headers=headers, timeout=30)
+    existing = SESSION.get(url, headers=headers, timeout=30)
     comment_id = None
     if existing.status_code == 200:
         for c in existing.json():
@@ -64,14 +62,14 @@ def post_comment(summary: str, repo: str, pr_number: str, token: str):
     body = f"{HEADER}\n{summary}\n\n<sub>Gerado automaticamente.</sub>"
     payload = json.dumps({"body": body})
     if comment_id:
-        r = requests.patch(
+        r = SESSION.patch(
             f"https://api.github.com/repos/{repo}/issues/comments/{comment_id}",
             headers=headers,
             data=payload,
             timeout=30,
         )
     else:
-        r = requests.post(url, headers=headers, data=payload, timeout=30)
+        r = SESSION.post(url, headers=headers, data=payload, timeout=30)
     print(f"[summary] status={r.status_code}")
 
 
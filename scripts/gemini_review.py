@@ -18,15 +18,13 @@ import os
 import sys
 from dataclasses import dataclass
 
-import requests
-
-try:
-    import google.generativeai as genai  # type: ignore
-except ImportError:  # pragma: no cover
-    genai = None  # type: ignore
+from _genai import load_genai
+from _http import build_session
+from _llm_cache import cached_generate
 
 COMMENT_HEADER = "<!-- gemini-ai-review -->"
 MODEL_NAME = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+SESSION = build_session()
 
 
 @dataclass
@@ -61,7 +59,8 @@ def build_prompt(diff: str) -> str:
 
 def configure_model() -> object | None:  # noqa: ANN401
     api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or not genai:
+    genai = load_genai() if api_key else None
+    if genai is None:
         print("[gemini] GEMINI_API_KEY ausente ou biblioteca não instalada; pulando análise.")
         return None
     genai.configure(api_key=api_key)
@@ -75,8 +74,7 @@ def configure_model() -> object | None:  # noqa: ANN401
 
 def generate_review(model, prompt: str) -> str:  # noqa: ANN001, ANN401
     try:
-        response = model.generate_content(prompt)
-        text = getattr(response, "text", None) or "(sem resposta)"
+        text = cached_generate(model, prompt, namespace="review", semantic=True) or "(sem resposta)"
         return text.strip()
     except Exception as e:  # pragma: no cover
         return f"(Falha ao gerar conteúdo: {e})"
@@ -87,7 +85,7 @@ def find_existing_comment(ctx: PRContext) -> int | None:
         "Authorization": f"Bearer {ctx.github_token}",
         "Accept": "application/vnd.github+json",
     }
-    r = requests.get(ctx.comments_api, headers=headers, timeout=30)
+    r = SESSION.get(ctx.comments_api, headers=headers, timeout=30)
     if r.status_code != 200:
         print(f"[gemini] Não foi possível listar comentários: {r.status_code}")
         return None
@@ -105,10 +103,10 @@ def post_comment(ctx: PRContext, body: str, update_id: int | None) -> None:
     payload = {"body": body}
     if update_id:
         url = f"https://api.github.com/repos/{ctx.repo_full}/issues/comments/{update_id}"
-        r = requests.patch(url, headers=headers, data=json.dumps(payload), timeout=30)
+        r = SESSION.patch(url, headers=headers, data=json.dumps(payload), timeout=30)
         action = "update"
     else:
-        r = requests.post(ctx.comments_api, headers=headers, data=json.dumps(payload), timeout=30)
+        r = SESSION.post(ctx.comments_api, headers=headers, data=json.dumps(payload), timeout=30)
         action = "create"
     if r.status_code not in (200, 201):
         print(f"[gemini] Falha ao {action} comentário: {r.status_code} -> {r.text[:300]}")
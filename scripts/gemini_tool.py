@@ -6,9 +6,11 @@ Subcomandos:
   summary        - Gera/rescreve sumário (comentário sticky)
   labels         - Sugere labels e aplica
   line-review    - (Beta) Gera comentários linha a linha em um PR
+  all            - Executa os quatro acima com uma única chamada ao modelo
 
 Todos dependem de variáveis padrão já usadas pelos workflows:
   REPO_FULL, PR_NUMBER, GITHUB_TOKEN, DIFF_FILE, PR_TITLE, PR_BODY, ALLOWED_LABELS
+  PR_ACTION (opcional, ``all``): ação do evento pull_request
 
 Falhas de IA não derrubam o processo (retorna 0).
 """
@@ -16,59 +18,161 @@ Falhas de IA não derrubam o processo (retorna 0).
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
 import json
 import os
-import re
 import sys
 from dataclasses import dataclass
 
-import requests
-
-try:  # pragma: no cover
-    import google.generativeai as genai  # type: ignore
-except ImportError:  # pragma: no cover
-    genai = None  # type: ignore
-
+from _gemini_cache import model_with_instructions
+from _genai import load_genai
+from _http import build_session
+from _llm_cache import cached_generate
 
 MODEL_NAME = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
 
-
-def _configure_model():  # noqa: ANN201
+# Subcomandos que esperam JSON pedem saída restrita a um schema: a resposta já é JSON válido e o
+# modelo não gasta tokens com texto ao redor.
+LABEL_SCHEMA = {
+    "type": "object",
+    "properties": {"labels": {"type": "array", "items": {"type": "string"}}},
+    "required": ["labels"],
+}
+_COMMENT_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "file": {"type": "string"},
+        "line": {"type": "integer"},
+        "body": {"type": "string"},
+    },
+    "required": ["file", "line", "body"],
+}
+LINE_REVIEW_SCHEMA = {
+    "type": "object",
+    "properties": {"comments": {"type": "array", "items": _COMMENT_ITEM_SCHEMA}},
+    "required": ["comments"],
+}
+ALL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "review": {"type": "string"},
+        "summary": {"type": "string"},
+        "labels": LABEL_SCHEMA["properties"]["labels"],
+        "line_comments": {"type": "array", "items": _COMMENT_ITEM_SCHEMA},
+    },
+    "required": ["review", "summary", "labels", "line_comments"],
+}
+
+
+def _json_config(schema: dict) -> dict:
+    return {"response_mime_type": "application/json", "response_schema": schema}
+
+
+SESSION = build_session()
+
+# Modelos já criados, por instrução fixa: ``cmd_all`` e subcomandos repetidos reaproveitam a
+# instância sem reconfigurar o SDK nem consultar o cache de contexto de novo.
+_MODEL: dict[str | None, object] = {}
+
+
+def _configure_model(instructions: str | None = None):  # noqa: ANN201
+    """Cria o modelo; ``instructions`` (parte fixa do prompt) vai para o cache de contexto."""
+    if instructions in _MODEL:
+        return _MODEL[instructions]
     api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or not genai:
+    genai = load_genai() if api_key else None
+    if genai is None:
         return None
     try:
-        genai.configure(api_key=api_key)
-        return genai.GenerativeModel(MODEL_NAME)
+        if not _MODEL:
+            genai.configure(api_key=api_key)
+        if instructions:
+            model = model_with_instructions(genai, MODEL_NAME, instructions)
+        else:
+            model = genai.GenerativeModel(MODEL_NAME)
     except Exception:  # pragma: no cover
         return None
+    _MODEL[instructions] = model
+    return model
 
 
-def _read_limited(path: str, limit: int) -> str:
+@functools.lru_cache(maxsize=4)
+def _read_file(path: str) -> str:
     try:
         with open(path, encoding="utf-8", errors="ignore") as f:
-            return f.read()[:limit]
+            return f.read()
     except FileNotFoundError:
         return ""
 
 
+def _read_limited(path: str, limit: int) -> str:
+    # O diff é lido uma vez por processo; cada subcomando recorta o seu limite.
+    return _read_file(path)[:limit]
+
+
 def _github_headers(token: str) -> dict:
     return {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
 
 
-def _list_issue_comments(repo: str, pr_number: int, token: str) -> list[dict]:
-    url = f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments"
-    r = requests.get(url, headers=_github_headers(token), timeout=30)
+def _graphql(token: str, query: str, variables: dict) -> dict:
+    """Executa uma consulta GraphQL; retorna ``data`` ou ``{}`` em caso de falha."""
+    r = SESSION.post(
+        "https://api.github.com/graphql",
+        headers=_github_headers(token),
+        data=json.dumps({"query": query, "variables": variables}),
+        timeout=30,
+    )
     if r.status_code != 200:
-        return []
-    data = r.json()
-    return data if isinstance(data, list) else []
+        return {}
+    payload = r.json()
+    if not isinstance(payload, dict) or payload.get("errors"):
+        return {}
+    data = payload.get("data")
+    return data if isinstance(data, dict) else {}
+
+
+_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      comments(first: 100) { nodes { databaseId body } }
+    }
+  }
+}
+"""
+
+
+def _list_issue_comments(repo: str, pr_number: int, token: str) -> list[dict]:
+    """Lista comentários do PR (``id``/``body``) em uma única requisição GraphQL."""
+    owner, _, name = repo.partition("/")
+    data = _graphql(
+        token, _COMMENTS_QUERY, {"owner": owner, "name": name, "number": int(pr_number)}
+    )
+    pr = (data.get("repository") or {}).get("pullRequest") or {}
+    nodes = (pr.get("comments") or {}).get("nodes") or []
+    return [
+        {"id": n.get("databaseId"), "body": n.get("body", "")}
+        for n in nodes
+        if isinstance(n, dict) and n.get("databaseId")
+    ]
 
 
 def _upsert_sticky_comment(
-    repo: str, pr_number: int, token: str, header_marker: str, body_markdown: str
+    repo: str,
+    pr_number: int,
+    token: str,
+    header_marker: str,
+    body_markdown: str,
+    comments: list[dict] | None = None,
 ) -> None:
-    comments = _list_issue_comments(repo, pr_number, token)
+    """Cria ou atualiza o comentário marcado com ``header_marker``.
+
+    ``comments`` permite reaproveitar uma listagem já feita quando vários comentários fixos são
+    publicados na mesma execução.
+    """
+    if comments is None:
+        comments = _list_issue_comments(repo, pr_number, token)
     existing_id: int | None = None
     for c in comments:
         if isinstance(c, dict) and str(c.get("body", "")).startswith(header_marker):
@@ -77,10 +181,28 @@ def _upsert_sticky_comment(
     payload = {"body": f"{header_marker}\n{body_markdown}"}
     if existing_id:
         url = f"https://api.github.com/repos/{repo}/issues/comments/{existing_id}"
-        requests.patch(url, headers=_github_headers(token), data=json.dumps(payload), timeout=30)
+        SESSION.patch(url, headers=_github_headers(token), data=json.dumps(payload), timeout=30)
     else:
         url = f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments"
-        requests.post(url, headers=_github_headers(token), data=json.dumps(payload), timeout=30)
+        SESSION.post(url, headers=_github_headers(token), data=json.dumps(payload), timeout=30)
+
+
+# ---------------- Prompts ---------------- #
+# Instruções invariantes vêm sempre primeiro e o conteúdo do PR (título/corpo/diff) por último:
+# o cache implícito do Gemini reaproveita o maior prefixo comum entre requisições recentes.
+_REVIEW_PREFIX = (
+    "Revise o diff de um Pull Request em um projeto Python. Foque em: corretude, complexidade, "
+    "legibilidade, segurança, edge cases e boas práticas. Responda em Markdown em Português."
+)
+_SUMMARY_PREFIX = (
+    "Resuma as mudanças deste Pull Request em formato Markdown com as seções: \n"
+    "### 🌟 Resumo\n### 📊 Principais Mudanças\n### 🎯 Impacto\n"
+    "Texto em Português. Seja sucinto."
+)
+_LABELS_PREFIX = (
+    "Você é um assistente que classifica Pull Requests. "
+    "Máximo {max_labels} labels. Use apenas: {allowed}."
+)
 
 
 # ---------------- Review Agregado ---------------- #
@@ -95,17 +217,16 @@ def cmd_review(args: argparse.Namespace) -> int:  # noqa: D401
     if not (repo and pr_number and token) and not args.local:
         return 0
     diff = _read_limited(diff_path, 20000)
-    model = _configure_model()
+    model = _configure_model(_REVIEW_PREFIX)
     if not model:
         return 0
-    prompt = (
-        "Revise o diff de um Pull Request em um projeto Python. Foque em: corretude, complexidade, "
-        "legibilidade, segurança, edge cases e boas práticas. Responda em Markdown em Português.\n\n"
-        + diff
-    )
     try:
-        resp = model.generate_content(prompt)
-        review_text = getattr(resp, "text", "(sem resposta)").strip()
+        review_text = (
+            cached_generate(
+                model, diff, namespace="review", system=_REVIEW_PREFIX, semantic=True
+            ).strip()
+            or "(sem resposta)"
+        )
     except Exception as e:  # pragma: no cover
         review_text = f"(falha geração: {e})"
     body = f"### Revisão Automática (Gemini)\n\n{review_text}\n\n—\n<sub>Diff truncado.</sub>"
@@ -128,18 +249,18 @@ def cmd_summary(args: argparse.Namespace) -> int:
     if not (repo and pr_number and token) and not args.local:
         return 0
     diff = _read_limited(diff_path, 25000)
-    model = _configure_model()
+    model = _configure_model(_SUMMARY_PREFIX)
     if not model:
         summary = "(Resumo indisponível: Gemini não configurado)"
     else:
-        prompt = (
-            "Resuma as mudanças deste Pull Request em formato Markdown com as seções: \n"
-            "### 🌟 Resumo\n### 📊 Principais Mudanças\n### 🎯 Impacto\n"
-            "Texto em Português. Seja sucinto.\n\nDIFF:\n" + diff[:20000]
-        )
+        prompt = "DIFF:\n" + diff[:20000]
         try:
-            resp = model.generate_content(prompt)
-            summary = getattr(resp, "text", "").strip() or "(sem conteúdo)"
+            summary = (
+                cached_generate(
+                    model, prompt, namespace="summary", system=_SUMMARY_PREFIX, semantic=True
+                ).strip()
+                or "(sem conteúdo)"
+            )
         except Exception as e:  # pragma: no cover
             summary = f"(Falha ao gerar resumo: {e})"
     body = f"{summary}\n\n<sub>Gerado automaticamente.</sub>"
@@ -160,16 +281,16 @@ def _parse_allowed() -> list[str]:
 
 
 def _extract_labels(raw: str, allowed: list[str], max_labels: int) -> list[str]:
-    match = re.search(r"\{.*\}", raw, flags=re.DOTALL)
-    if not match:
-        return []
     try:
-        data = json.loads(match.group(0))
-        labels = data.get("labels", [])
+        labels = json.loads(raw).get("labels", [])
     except Exception:
         return []
+    return _filter_labels(labels, allowed, max_labels)
+
+
+def _filter_labels(labels: object, allowed: list[str], max_labels: int) -> list[str]:
     out: list[str] = []
-    for item in labels:
+    for item in labels if isinstance(labels, list) else []:
         if isinstance(item, str):
             name = item.strip().lower()
             if name in allowed and name not in out:
@@ -191,24 +312,41 @@ def cmd_labels(args: argparse.Namespace) -> int:
     if not (repo and pr_number and token and allowed) and not args.local:
         return 0
     diff = _read_limited(diff_path, 15000)
-    model = _configure_model()
+    instructions = _LABELS_PREFIX.format(
+        max_labels=max_labels, allowed=", ".join(allowed) or "(nenhuma)"
+    )
+    model = _configure_model(instructions)
     if not model:
         return 0
-    allow_str = ", ".join(allowed) or "(nenhuma)"
-    prompt = (
-        'Você é um assistente que classifica Pull Requests. Retorne SOMENTE JSON: {"labels": []}. '
-        f"Máximo {max_labels}. Use apenas: {allow_str}. Sem explicações.\n\nTÍTULO: {title}\n\nCORPO:\n{body_text[:3000]}\n\nDIFF:\n{diff[:8000]}"
-    )
+    prompt = f"TÍTULO: {title}\n\nCORPO:\n{body_text[:3000]}\n\nDIFF:\n{diff[:8000]}"
     try:
-        resp = model.generate_content(prompt)
-        raw = getattr(resp, "text", "")
+        raw = cached_generate(
+            model,
+            prompt,
+            namespace="labels",
+            system=instructions,
+            generation_config=_json_config(LABEL_SCHEMA),
+            until_json=True,
+        )
     except Exception as e:  # pragma: no cover
         raw = f'{{"labels":[]}}  /* error: {e} */'
     labels = _extract_labels(raw, allowed, max_labels)
+    _publish_labels(args, repo, pr_number, token, labels)
+    return 0
+
+
+def _publish_labels(
+    args: argparse.Namespace,
+    repo: str,
+    pr_number: str,
+    token: str,
+    labels: list[str],
+    comments: list[dict] | None = None,
+) -> None:
     # aplica
     if labels and not args.local:
         url = f"https://api.github.com/repos/{repo}/issues/{pr_number}/labels"
-        requests.post(
+        SESSION.post(
             url,
             headers=_github_headers(token),
             data=json.dumps({"labels": labels}),
@@ -218,8 +356,7 @@ def cmd_labels(args: argparse.Namespace) -> int:
     if args.local:
         print(comment_body)
     else:
-        _upsert_sticky_comment(repo, int(pr_number), token, LABELS_HEADER, comment_body)
-    return 0
+        _upsert_sticky_comment(repo, int(pr_number), token, LABELS_HEADER, comment_body, comments)
 
 
 # ---------------- Line-by-line Review (Beta) ---------------- #
@@ -234,7 +371,7 @@ class FilePatch:
 
 def _list_pr_files(repo: str, pr_number: int, token: str) -> list[FilePatch]:
     url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/files"
-    r = requests.get(url, headers=_github_headers(token), timeout=30)
+    r = SESSION.get(url, headers=_github_headers(token), timeout=30)
     if r.status_code != 200:
         return []
     out: list[FilePatch] = []
@@ -250,56 +387,114 @@ def _list_pr_files(repo: str, pr_number: int, token: str) -> list[FilePatch]:
     return out[:20]  # limit de arquivos analisados
 
 
+def _serialize_patches(files: list[FilePatch]) -> str:
+    # Montar bloco compacto para IA
+    serialized = []
+    for fp in files:
+        serialized.append(f"FILE: {fp.filename}\nPATCH:\n{fp.patch}\n---")
+    return "\n".join(serialized)[:18000]
+
+
+def _diff_without(diff: str, filenames: set[str]) -> str:
+    """Remove do diff os arquivos já enviados em FILES: cada patch entra uma única vez no prompt."""
+    head, *chunks = ("\n" + diff).split("\ndiff --git ")
+    kept = [
+        f"\ndiff --git {c}"
+        for c in chunks
+        if c.split("\n", 1)[0].rsplit(" b/", 1)[-1] not in filenames
+    ]
+    return (head + "".join(kept)).lstrip("\n")
+
+
+def _parse_line_comments(items: object) -> list[dict]:
+    comments: list[dict] = []
+    for c in items if isinstance(items, list) else []:
+        if (
+            isinstance(c, dict)
+            and isinstance(c.get("file"), str)
+            and isinstance(c.get("line"), int)
+            and isinstance(c.get("body"), str)
+        ):
+            comments.append(
+                {
+                    "path": c["file"],
+                    "line": c["line"],
+                    "body": c["body"][:500],
+                    "side": "RIGHT",
+                }
+            )
+            if len(comments) >= 40:
+                break
+    return comments
+
+
+_LINE_REVIEW_PREFIX = (
+    "Você é um revisor de código. Para cada alteração relevante proponha zero ou mais comentários "
+    "(file = caminho, line = linha no arquivo novo). "
+    "Comentários curtos, em Português, sugerindo melhorias objetivas."
+)
+
+
 def cmd_line_review(args: argparse.Namespace) -> int:
     repo = os.getenv("REPO_FULL") or os.getenv("GITHUB_REPOSITORY")
     pr_number = os.getenv("PR_NUMBER")
     token = os.getenv("GITHUB_TOKEN")
     if not (repo and pr_number and token) and not args.local:
         return 0
-    model = _configure_model()
+    model = _configure_model(_LINE_REVIEW_PREFIX)
     if not model:
         return 0
     files = _list_pr_files(repo, pr_number, token)
-    # Montar bloco compacto para IA
-    serialized = []
-    for fp in files:
-        serialized.append(f"FILE: {fp.filename}\nPATCH:\n{fp.patch}\n---")
-    joined = "\n".join(serialized)[:18000]
-    prompt = (
-        "Você é um revisor de código. Para cada alteração relevante proponha zero ou mais comentários. "
-        'Retorne JSON: {"comments":[{"file":"path","line":N,"body":"texto"}, ...]}. '
-        "Comentários curtos, em Português, sugerindo melhorias objetivas. Sem texto fora do JSON.\n\n"
-        + joined
-    )
-    try:
-        resp = model.generate_content(prompt)
-        raw = getattr(resp, "text", "")
-    except Exception as e:  # pragma: no cover
-        raw = f'{{"comments":[]}} /* error {e} */'
     comments: list[dict] = []
-    m = re.search(r"\{.*\}", raw, flags=re.DOTALL)
-    if m:
-        try:
-            data = json.loads(m.group(0))
-            for c in data.get("comments", []):
-                if (
-                    isinstance(c, dict)
-                    and isinstance(c.get("file"), str)
-                    and isinstance(c.get("line"), int)
-                    and isinstance(c.get("body"), str)
-                ):
-                    comments.append(
-                        {
-                            "path": c["file"],
-                            "line": c["line"],
-                            "body": c["body"][:500],
-                            "side": "RIGHT",
-                        }
-                    )
-                    if len(comments) >= 40:
-                        break
-        except Exception:  # pragma: no cover
-            pass
+    seen: set[tuple[str, int]] = set()
+    for file_comments in asyncio.run(_review_files(model, _LINE_REVIEW_PREFIX, files)):
+        for c in file_comments:
+            if (c["path"], c["line"]) not in seen and len(comments) < 40:
+                seen.add((c["path"], c["line"]))
+                comments.append(c)
+    _publish_line_comments(args, repo, pr_number, token, comments)
+    return 0
+
+
+# Requisições simultâneas ao modelo durante a revisão linha a linha
+_LINE_REVIEW_CONCURRENCY = 4
+
+
+def _review_file(model, instructions: str, fp: FilePatch) -> list[dict]:  # noqa: ANN001
+    try:
+        raw = cached_generate(
+            model,
+            _serialize_patches([fp]),
+            namespace="line-review",
+            system=instructions,
+            generation_config=_json_config(LINE_REVIEW_SCHEMA),
+            until_json=True,
+        )
+        return _parse_line_comments(json.loads(raw).get("comments", []))
+    except Exception:  # pragma: no cover
+        return []
+
+
+async def _review_files(model, instructions: str, files: list[FilePatch]) -> list[list[dict]]:  # noqa: ANN001
+    """Revisa cada arquivo em uma requisição própria, com no máximo N requisições em voo."""
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(_LINE_REVIEW_CONCURRENCY)
+
+    async def bound(fp: FilePatch) -> list[dict]:
+        async with sem:
+            return await loop.run_in_executor(None, _review_file, model, instructions, fp)
+
+    return await asyncio.gather(*(bound(fp) for fp in files))
+
+
+def _publish_line_comments(
+    args: argparse.Namespace,
+    repo: str,
+    pr_number: str,
+    token: str,
+    comments: list[dict],
+    issue_comments: list[dict] | None = None,
+) -> None:
     # Cria pull request review se houver comentários
     if args.local:
         if comments:
@@ -318,7 +513,7 @@ def cmd_line_review(args: argparse.Namespace) -> int:
                 "body": "Revisão linha a linha (Beta)",
                 "comments": comments,
             }
-            requests.post(
+            SESSION.post(
                 review_url, headers=_github_headers(token), data=json.dumps(payload), timeout=30
             )
         else:
@@ -329,7 +524,96 @@ def cmd_line_review(args: argparse.Namespace) -> int:
                 token,
                 LINE_REVIEW_TAG,
                 "Nenhum comentário linha a linha gerado (pode ser mudança trivial ou parsing falhou).",
+                issue_comments,
             )
+
+
+# ---------------- Todos em uma chamada ---------------- #
+_ALL_PREFIX = (
+    "Você é um assistente que analisa Pull Requests de um projeto Python. Preencha:\n"
+    "- review: revisão em Markdown focada em corretude, complexidade, legibilidade, "
+    "segurança, edge cases e boas práticas;\n"
+    "- summary: resumo em Markdown com as seções ### 🌟 Resumo, ### 📊 Principais Mudanças "
+    "e ### 🎯 Impacto, sucinto;\n"
+    "- labels: no máximo {max_labels}, usando apenas: {allowed};\n"
+    "- line_comments: comentários curtos e objetivos sobre os patches da seção FILES "
+    "(file = caminho, line = linha no arquivo novo; vazia se não houver FILES).\n"
+    "A seção DIFF traz apenas os arquivos que não estão em FILES.\n"
+    "Texto em Português."
+)
+
+
+# Comentários linha a linha não são sticky (cada execução cria um review novo): só são publicados
+# quando o código muda, não em edições de título/corpo (edited, ready_for_review).
+LINE_REVIEW_ACTIONS = frozenset({"opened", "synchronize", "reopened"})
+
+
+def cmd_all(args: argparse.Namespace) -> int:
+    """Gera review, summary, labels e line-review com uma única chamada ao modelo."""
+    repo = os.getenv("REPO_FULL") or os.getenv("GITHUB_REPOSITORY")
+    pr_number = os.getenv("PR_NUMBER")
+    token = os.getenv("GITHUB_TOKEN")
+    title = os.getenv("PR_TITLE", "")
+    body_text = os.getenv("PR_BODY", "")
+    diff_path = os.getenv("DIFF_FILE", "diff.txt")
+    allowed = _parse_allowed()
+    max_labels = int(os.getenv("MAX_LABELS", "3"))
+    action = os.getenv("PR_ACTION", "")
+    if not (repo and pr_number and token) and not args.local:
+        return 0
+    instructions = _ALL_PREFIX.format(
+        max_labels=max_labels, allowed=", ".join(allowed) or "(nenhuma)"
+    )
+    model = _configure_model(instructions)
+    if not model:
+        return 0
+    files = _list_pr_files(repo, pr_number, token) if (repo and pr_number and token) else []
+    # Mesmo orçamento de 20k caracteres para os patches: FILES primeiro, o resto do diff depois
+    patches = _serialize_patches(files) if files else ""
+    diff = _diff_without(_read_file(diff_path), {fp.filename for fp in files})
+    diff = diff[: 20000 - len(patches)]
+    prompt = f"TÍTULO: {title}\n\nCORPO:\n{body_text[:3000]}"
+    if patches:
+        prompt += f"\n\nFILES:\n{patches}"
+    if diff.strip():
+        prompt += f"\n\nDIFF:\n{diff}"
+    try:
+        raw = cached_generate(
+            model,
+            prompt,
+            namespace="all",
+            system=instructions,
+            generation_config=_json_config(ALL_SCHEMA),
+            until_json=True,
+        )
+    except Exception as e:  # pragma: no cover
+        raw = f"{{}} /* error {e} */"
+    try:
+        parsed = json.loads(raw)
+    except ValueError:
+        parsed = {}
+    data: dict = parsed if isinstance(parsed, dict) else {}
+
+    review_text = str(data.get("review") or "(sem resposta)").strip()
+    review_body = (
+        f"### Revisão Automática (Gemini)\n\n{review_text}\n\n—\n<sub>Diff truncado.</sub>"
+    )
+    summary = str(data.get("summary") or "(sem conteúdo)").strip()
+    summary_body = f"{summary}\n\n<sub>Gerado automaticamente.</sub>"
+    # Uma única listagem de comentários atende todos os comentários fixos desta execução
+    existing = [] if args.local else _list_issue_comments(repo, int(pr_number), token)
+    if args.local:
+        print(review_body)
+        print(summary_body)
+    else:
+        _upsert_sticky_comment(repo, int(pr_number), token, REVIEW_HEADER, review_body, existing)
+        _upsert_sticky_comment(repo, int(pr_number), token, SUMMARY_HEADER, summary_body, existing)
+    if allowed:
+        labels = _filter_labels(data.get("labels", []), allowed, max_labels)
+        _publish_labels(args, repo, pr_number, token, labels, existing)
+    if files and (not action or action in LINE_REVIEW_ACTIONS):
+        comments = _parse_line_comments(data.get("line_comments", []))
+        _publish_line_comments(args, repo, pr_number, token, comments, existing)
     return 0
 
 
@@ -346,6 +630,7 @@ def build_parser() -> argparse.ArgumentParser:
     sub.add_parser("summary")
     sub.add_parser("labels")
     sub.add_parser("line-review")
+    sub.add_parser("all")
     return p
 
 
@@ -356,6 +641,7 @@ def main(argv: list[str] | None = None) -> int:
         "summary": cmd_summary,
         "labels": cmd_labels,
         "line-review": cmd_line_review,
+        "all": cmd_all,
     }
     func = mapping[args.cmd]
     return func(args)
@@ -10,16 +10,20 @@ Sem --apply roda em modo somente leitura.
 from __future__ import annotations
 
 import argparse
+import os
 from datetime import datetime
 from pathlib import Path
 
 HEADER = "Projeto Demo - MIT License"
 EXTS = {".py", ".yml", ".yaml", ".toml", ".sh"}
 IGNORE_DIRS = {".git", "dist", "build", "node_modules", ".venv", "__pycache__"}
+YEAR = datetime.now().year
+# O cabeçalho fica nas primeiras linhas (após um eventual shebang); basta olhar o início
+HEADER_SCAN_CHARS = 512
 
 
 def needs_header(text: str) -> bool:
-    return HEADER not in text.splitlines()[:5]
+    return HEADER not in text[:HEADER_SCAN_CHARS]
 
 
 def update_file(path: Path, apply: bool) -> bool:
@@ -29,13 +33,11 @@ def update_file(path: Path, apply: bool) -> bool:
         return False
     if not needs_header(content):
         return False
-    year = datetime.now().year
-    header_line = f"# {HEADER} © {year}\n"
+    header_line = f"# {HEADER} © {YEAR}\n"
     if content.startswith("#!"):
         # preserve shebang
-        lines = content.splitlines(True)
-        shebang, rest = lines[0], "".join(lines[1:])
-        new_content = shebang + header_line + rest
+        shebang, sep, rest = content.partition("\n")
+        new_content = shebang + sep + header_line + rest
     else:
         new_content = header_line + content
     if apply:
@@ -48,16 +50,15 @@ def main():  # noqa: D401
     parser.add_argument("--apply", action="store_true", help="Escreve alterações")
     args = parser.parse_args()
     changed = checked = 0
-    for p in Path.cwd().rglob("*"):
-        if p.is_dir():
-            if p.name in IGNORE_DIRS:
-                continue
-            else:
-                continue
-        if p.suffix in EXTS:
-            checked += 1
-            if update_file(p, args.apply):
-                changed += 1
+    for root, dirs, files in os.walk(Path.cwd()):
+        # Poda in-place: os.walk não desce nos diretórios ignorados
+        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+        for name in files:
+            p = Path(root) / name
+            if p.suffix in EXTS:
+                checked += 1
+                if update_file(p, args.apply):
+                    changed += 1
     print(f"Headers verificados: {checked}, atualizados: {changed}")
 
 
@@ -3,6 +3,6 @@
 Fornece função simples para somar e normalizar listas.
 """
 
-from .mathutils import normalizar, soma
+from .mathutils import normalizar, normalizar_np, soma
 
-__all__ = ["soma", "normalizar"]
+__all__ = ["normalizar", "normalizar_np", "soma"]
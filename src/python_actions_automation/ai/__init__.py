@@ -4,22 +4,35 @@ Exposição de funções utilitárias de alto nível:
 - generate_review(diff: str) -> str
 - generate_summary(diff: str, max_chars=800) -> str
 - suggest_labels(title: str, body: str, diff: str, allowed: list[str], max_labels=3) -> list[str]
+- generate_summary_async / suggest_labels_async: versões assíncronas, agrupadas em lotes
+- analyze_pr / analyze_pr_async: as três análises de um PR em paralelo -> dict
 
 Todas usam a chave GEMINI_API_KEY se presente. Caso contrário retornam respostas neutras.
+O ambiente é lido uma vez; reset_ai_config() força a releitura.
 """
 
 from .core import (
     GeminiClient,
     GeminiNotAvailableError,
+    analyze_pr,
+    analyze_pr_async,
     generate_review,
     generate_summary,
+    generate_summary_async,
+    reset_ai_config,
     suggest_labels,
+    suggest_labels_async,
 )
 
 __all__ = [
     "GeminiClient",
     "GeminiNotAvailableError",
+    "analyze_pr",
+    "analyze_pr_async",
     "generate_review",
     "generate_summary",
+    "generate_summary_async",
+    "reset_ai_config",
     "suggest_labels",
+    "suggest_labels_async",
 ]
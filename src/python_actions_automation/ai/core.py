@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
+import time
 from collections.abc import Iterable
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 
 """Camada interna de integração com Gemini.
 
@@ -13,36 +20,358 @@ Uso básico:
 Projeto evita lançar exceções fatais quando a API não está configurada.
 """
 
-try:  # pragma: no cover - import opcional
-    import google.generativeai as genai  # type: ignore
-except Exception:  # pragma: no cover
-    genai = None  # type: ignore
+# SDK opcional, importado na primeira chamada (_load_genai): carrega gRPC/protobuf/auth e custa
+# centenas de ms que quem só usa mathutils ou não tem GEMINI_API_KEY não precisa pagar.
+genai = None
+
+try:  # opcional: extra "fast"; parser JSON 2-5x mais rápido
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+# Cache em disco das respostas, por hash de (modelo, prompt). TTL em segundos; 0 desativa.
+_CACHE_DIR = Path(os.getenv("PAA_GEMINI_CACHE_DIR", str(Path.home() / ".cache" / "paa_gemini")))
+_CACHE_TTL = int(os.getenv("PAA_GEMINI_CACHE_TTL", "86400"))
+
+
+# Instruções fixas no início de cada prompt (bytes idênticos entre chamadas, favorecendo cache de
+# prefixo); a parte dinâmica vem depois de "\n\n".
+_REVIEW_PREFIX = (
+    "Revise este diff de código Python. Liste: Problemas Potenciais, "
+    "Melhorias Recomendadas, Testes Sugeridos. Resposta em Markdown concisa."
+)
+_SUMMARY_PREFIX_TMPL = (
+    "Resuma mudanças de um Pull Request em até {max_chars} characters. "
+    "Formato: 1 linha de resumo + lista de bullets. Texto em Português."
+)
+_LABELS_PREFIX = (
+    'Classifique o Pull Request. Retorne apenas JSON: {{"labels": [..]}}. '
+    "Máx {max_labels} labels. Use somente: {allow_str}. Sem explicações extras."
+)
+
+
+# Diffs acima dos limites são condensados (map-reduce): arquivos são agrupados em trechos de até
+# _FILE_CHUNK_LIMIT, cada trecho é resumido e os resumos alimentam o prompt final. O número de
+# chamadas é limitado ao que cabe no orçamento do prompt final (~_SUMMARY_CHARS_PER_CALL por
+# resumo, no máximo _MAX_CONDENSE_CALLS); os arquivos restantes entram só pelo caminho.
+_REVIEW_LIMIT = 18000
+_SUMMARY_LIMIT = 12000
+_FILE_CHUNK_LIMIT = 8000
+_SUMMARY_CHARS_PER_CALL = 1500
+_MAX_CONDENSE_CALLS = 12
+_CONDENSE_WORKERS = 4
+# Teto estimado de tokens por prompt: acima dele o diff é condensado ou o pedido nem é enviado
+_MAX_TOKENS = int(os.getenv("PAA_GEMINI_MAX_TOKENS", "30000"))
+_FILE_SUMMARY_PREFIX = (
+    "Resuma as mudanças deste trecho de diff em Português: para cada arquivo, o caminho seguido "
+    "de até 3 bullets curtos, destacando riscos ou possíveis bugs."
+)
+_CONDENSED_HEADER = "RESUMOS POR ARQUIVO (diff extenso demais para envio integral):\n"
+
+
+def _split_diff_by_file(diff: str) -> list[str]:
+    """Divide um diff unificado em um trecho por arquivo (cabeçalhos ``diff --git``)."""
+    chunks: list[str] = []
+    current: list[str] = []
+    for line in diff.splitlines():
+        if line.startswith("diff --git ") and current:
+            chunks.append("\n".join(current))
+            current = []
+        current.append(line)
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _estimate_tokens(s: str) -> int:
+    """Estimativa local barata (~4 bytes por token), suficiente para evitar pedidos recusados."""
+    return max(1, len(s.encode("utf-8")) // 4)
+
+
+def _fits(text: str, limit: int) -> bool:
+    return len(text) <= limit and _estimate_tokens(text) <= _MAX_TOKENS
+
+
+def _check_prompt_size(prompt: str) -> None:
+    tokens = _estimate_tokens(prompt)
+    if tokens > _MAX_TOKENS:
+        raise ValueError(f"prompt com ~{tokens} tokens excede o limite de {_MAX_TOKENS}")
+
+
+def _pack_file_chunks(chunks: list[str], limit: int) -> list[list[str]]:
+    """Agrupa trechos consecutivos (cada um cortado em ``limit``) em grupos de até ``limit``."""
+    groups: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+    for chunk in chunks:
+        chunk = chunk[:limit]
+        if current and size + len(chunk) + 1 > limit:
+            groups.append(current)
+            current, size = [], 0
+        current.append(chunk)
+        size += len(chunk) + 1
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _diff_path(chunk: str) -> str:
+    header = chunk.split("\n", 1)[0]
+    return header.rsplit(" b/", 1)[-1] if header.startswith("diff --git ") else "(sem cabeçalho)"
+
+
+def _normalize_tail(text: str) -> str:
+    """Remove espaços finais e unifica quebras de linha, para entradas equivalentes coincidirem."""
+    return "\n".join(line.rstrip() for line in text.splitlines())
 
 
 class GeminiNotAvailableError(RuntimeError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _resolved_config() -> tuple[str | None, str]:
+    # Lido uma vez; após alterar GEMINI_API_KEY/GEMINI_MODEL chame reset_ai_config()
+    return os.getenv("GEMINI_API_KEY"), os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+
+
+def reset_ai_config() -> None:
+    """Descarta a configuração e os modelos em cache, relendo o ambiente na próxima chamada."""
+    _resolved_config.cache_clear()
+    _build_model.cache_clear()
+
+
+def _load_genai():  # noqa: ANN202
+    global genai
+    if genai is None:
+        try:
+            import google.generativeai as genai  # type: ignore
+        except Exception as e:  # pragma: no cover
+            raise GeminiNotAvailableError(
+                "Gemini não disponível: install google-generativeai"
+            ) from e
+    return genai
+
+
 def _ensure_client():  # noqa: ANN201
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or not genai:
+    api_key, model_name = _resolved_config()
+    if not api_key:
         raise GeminiNotAvailableError(
             "Gemini não disponível: defina GEMINI_API_KEY e install google-generativeai"
         )
+    _load_genai()
+    return _build_model(api_key, model_name)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_model(api_key: str, model_name: str):  # noqa: ANN202
+    # Configuração fixa por (chave, modelo): o SDK é configurado e o modelo criado uma única vez
     genai.configure(api_key=api_key)
-    model_name = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
     return genai.GenerativeModel(model_name)
 
 
+def _cache_path(model, prompt: str) -> Path:  # noqa: ANN001
+    key = f"{getattr(model, 'model_name', '')}\0{prompt}"
+    return _CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.txt"
+
+
+def _cache_get(path: Path) -> str | None:
+    if _CACHE_TTL <= 0:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime >= _CACHE_TTL:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _cache_put(path: Path, text: str) -> None:
+    if _CACHE_TTL <= 0:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    except OSError:
+        pass
+    _prune_cache(path.parent)
+
+
+# Diretórios já podados neste processo: a varredura acontece só na primeira escrita em cada um
+_PRUNED_DIRS: set[Path] = set()
+
+
+def _prune_cache(directory: Path) -> None:
+    """Apaga as respostas com mtime mais antigo que ``_CACHE_TTL`` (uma vez por processo)."""
+    if directory in _PRUNED_DIRS:
+        return
+    _PRUNED_DIRS.add(directory)
+    cutoff = time.time() - _CACHE_TTL
+    for path in directory.glob("*.txt"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_allowed(allowed: tuple[str, ...]) -> frozenset[str]:
+    return frozenset(a.strip().lower() for a in allowed if a.strip())
+
+
+def _extract_json_object(s: str) -> str | None:
+    """Retorna o primeiro objeto JSON balanceado de ``s`` (uma única passada, sem regex)."""
+    start = s.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(s)):
+        ch = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start : i + 1]
+    return None
+
+
+class _BatchedGeminiClient:
+    """Agrupa prompts de chamadores concorrentes e os envia juntos ao modelo.
+
+    Pedidos que chegam dentro de ``max_latency_ms`` (ou até ``max_batch_size``) formam um lote;
+    o lote é despachado com ``generate_content_async`` em paralelo via ``asyncio.gather``.
+    """
+
+    def __init__(self, max_batch_size: int = 8, max_latency_ms: float = 20.0) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_latency_ms = max_latency_ms
+        self._queue: list[tuple[str, asyncio.Future[str]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # Fila e timer valem para um único loop; cada asyncio.run() novo recomeça do zero
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Referências fortes às tarefas de despacho: o loop guarda só referências fracas
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def generate(self, prompt: str) -> str:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Restos de um loop anterior (ex.: encerrado antes do timer disparar) nunca seriam
+            # despachados e o timer pendente impediria novos flushes
+            self._loop = loop
+            self._queue, self._timer = [], None
+        future: asyncio.Future[str] = loop.create_future()
+        self._queue.append((prompt, future))
+        if len(self._queue) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency_ms / 1000, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[str]]]) -> None:
+        # Toda falha vai para os futures do lote: nenhum chamador fica esperando para sempre
+        try:
+            try:
+                model = _ensure_client()
+                results: list = await asyncio.gather(
+                    *(self._generate(model, prompt) for prompt, _ in batch),
+                    return_exceptions=True,
+                )
+            except Exception as e:
+                results = [e] * len(batch)
+            for (_, future), result in zip(batch, results, strict=True):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    @staticmethod
+    async def _generate(model, prompt: str) -> str:  # noqa: ANN001
+        path = _cache_path(model, prompt)
+        cached = _cache_get(path)
+        if cached is not None:
+            return cached
+        resp = await model.generate_content_async(prompt)
+        text = getattr(resp, "text", "").strip()
+        if text:
+            _cache_put(path, text)
+        return text
+
+
+def _load_json_object(raw: str) -> object | None:
+    """Decodifica o objeto JSON contido na resposta do modelo.
+
+    Caminho rápido: do primeiro ``{`` ao último ``}`` via find/rfind, o caso comum de resposta
+    contendo só o objeto. Se sobrar texto com chaves após o objeto, recorre ao scanner.
+    """
+    i = raw.find("{")
+    j = raw.rfind("}")
+    if i == -1 or j <= i:
+        return None
+    try:
+        return _json_loads(raw[i : j + 1])
+    except ValueError:
+        pass
+    obj = _extract_json_object(raw)
+    if obj is None:
+        return None
+    try:
+        return _json_loads(obj)
+    except ValueError:
+        return None
+
+
 @dataclass
 class GeminiClient:
     safe: bool = True  # se True, falhas retornam resposta neutra
+    _batcher: _BatchedGeminiClient = field(
+        default_factory=_BatchedGeminiClient, init=False, repr=False, compare=False
+    )
 
     def _call(self, prompt: str) -> str:
         try:
+            _check_prompt_size(prompt)
             model = _ensure_client()
+            # Mesmo diff entre execuções (rebase, re-run do workflow) não chama a API de novo
+            path = _cache_path(model, prompt)
+            cached = _cache_get(path)
+            if cached is not None:
+                return cached
             resp = model.generate_content(prompt)
-            return getattr(resp, "text", "").strip() or "(resposta vazia)"
+            text = getattr(resp, "text", "").strip()
+            if not text:
+                return "(resposta vazia)"
+            _cache_put(path, text)
+            return text
         except GeminiNotAvailableError:
             if self.safe:
                 return "(Gemini indisponível)"
@@ -52,27 +381,172 @@ class GeminiClient:
                 return f"(falha na geração: {e})"
             raise
 
+    async def _call_async(self, prompt: str) -> str:
+        try:
+            _check_prompt_size(prompt)
+            return await self._batcher.generate(prompt) or "(resposta vazia)"
+        except GeminiNotAvailableError:
+            if self.safe:
+                return "(Gemini indisponível)"
+            raise
+        except Exception as e:  # pragma: no cover
+            if self.safe:
+                return f"(falha na geração: {e})"
+            raise
+
+    # ---- Condensação de diffs grandes ---- #
+    @staticmethod
+    def _plan_condense(text: str, limit: int) -> tuple[list[str], list[str]]:
+        """Prompts de resumo que cabem no orçamento de ``limit`` e caminhos que ficaram de fora."""
+        groups = _pack_file_chunks(_split_diff_by_file(text), _FILE_CHUNK_LIMIT)
+        max_calls = max(1, min(_MAX_CONDENSE_CALLS, limit // _SUMMARY_CHARS_PER_CALL))
+        prompts = [_FILE_SUMMARY_PREFIX + "\n\n" + "\n".join(g) for g in groups[:max_calls]]
+        omitted = [_diff_path(chunk) for group in groups[max_calls:] for chunk in group]
+        return prompts, omitted
+
+    @staticmethod
+    def _join_condensed(parts: list[str], omitted: list[str], limit: int) -> str:
+        text = _CONDENSED_HEADER + "\n\n".join(parts)
+        if omitted:
+            text += "\n\nArquivos não resumidos: " + ", ".join(omitted)
+        return text[:limit]
+
+    def _condense(self, diff: str, limit: int) -> str:
+        """Diff normalizado; acima de ``limit`` (ou de _MAX_TOKENS), vira resumos por trecho."""
+        text = _normalize_tail(diff)
+        if _fits(text, limit):
+            return text
+        prompts, omitted = self._plan_condense(text, limit)
+        with ThreadPoolExecutor(max_workers=_CONDENSE_WORKERS) as ex:
+            parts = list(ex.map(self._call, prompts))
+        return self._join_condensed(parts, omitted, limit)
+
+    async def _condense_async(self, diff: str, limit: int) -> str:
+        text = _normalize_tail(diff)
+        if _fits(text, limit):
+            return text
+        prompts, omitted = self._plan_condense(text, limit)
+        parts = await asyncio.gather(*(self._call_async(p) for p in prompts))
+        return self._join_condensed(parts, omitted, limit)
+
+    # ---- Prompts e parsing (compartilhados pelas versões síncrona e assíncrona) ---- #
+    @staticmethod
+    def _summary_prompt(condensed: str, max_chars: int) -> str:
+        prefix = _SUMMARY_PREFIX_TMPL.format(max_chars=max_chars)
+        return prefix + "\n\n" + condensed
+
+    @staticmethod
+    def _labels_prompt(
+        title: str, body: str, diff: str, allow: frozenset[str], max_labels: int
+    ) -> str:
+        # Ordenado: o mesmo conjunto gera sempre o mesmo prefixo de prompt
+        allow_str = ", ".join(sorted(allow)) or "(none)"
+        prefix = _LABELS_PREFIX.format(max_labels=max_labels, allow_str=allow_str)
+        tail = f"TITLE: {title}\nBODY:\n{body[:3000]}\nDIFF:\n{diff[:8000]}"
+        return prefix + "\n\n" + _normalize_tail(tail)
+
+    @staticmethod
+    def _parse_labels(raw: str, allow: frozenset[str], max_labels: int) -> list[str]:
+        out: list[str] = []
+        data = _load_json_object(raw)
+        labels = data.get("labels") if isinstance(data, dict) else None
+        if isinstance(labels, list):
+            for x in labels:
+                if isinstance(x, str):
+                    name = x.lower().strip()
+                    if name in allow and name not in out:
+                        out.append(name)
+                    if len(out) >= max_labels:
+                        break
+        return out
+
     # ---- Funções de Alto Nível ---- #
     def review(self, diff: str) -> str:
-        prompt = (
-            "Revise este diff de código Python. Liste: Problemas Potenciais, "
-            "Melhorias Recomendadas, Testes Sugeridos. Resposta em Markdown concisa.\n\n"
-            + diff[:18000]
-        )
-        return self._call(prompt)
+        return self._review_condensed(self._condense(diff, _REVIEW_LIMIT))
+
+    def _review_condensed(self, condensed: str) -> str:
+        return self._call(_REVIEW_PREFIX + "\n\n" + condensed)
 
     def summary(self, diff: str, max_chars: int = 800) -> str:
-        prompt = (
-            (
-                f"Resuma mudanças de um Pull Request em até {max_chars} characters. "
-                "Formato: 1 linha de resumo + lista de bullets. Texto em Português."
-            )
-            + "\n\n"
-            + diff[:12000]
-        )
-        text = self._call(prompt)
+        return self._summary_condensed(self._condense(diff, _SUMMARY_LIMIT), max_chars)
+
+    def _summary_condensed(self, condensed: str, max_chars: int) -> str:
+        return self._call(self._summary_prompt(condensed, max_chars))[:max_chars]
+
+    @staticmethod
+    def _summary_from_review_input(condensed: str) -> str | None:
+        """Entrada do resumo derivada da do review, ou None se o diff precisa ser condensado.
+
+        Resumos por arquivo já prontos são apenas recortados no limite do resumo; um diff integral
+        entre os dois limites volta a ser condensado, como em ``summary``.
+        """
+        if _fits(condensed, _SUMMARY_LIMIT):
+            return condensed
+        if condensed.startswith(_CONDENSED_HEADER):
+            return condensed[:_SUMMARY_LIMIT]
+        return None
+
+    def _analyze_summary(self, condensed: str, max_chars: int) -> str:
+        text = self._summary_from_review_input(condensed)
+        if text is None:
+            text = self._condense(condensed, _SUMMARY_LIMIT)
+        return self._summary_condensed(text, max_chars)
+
+    async def summary_async(self, diff: str, max_chars: int = 800) -> str:
+        condensed = await self._condense_async(diff, _SUMMARY_LIMIT)
+        text = await self._call_async(self._summary_prompt(condensed, max_chars))
         return text[:max_chars]
 
+    def analyze(
+        self,
+        title: str,
+        body: str,
+        diff: str,
+        allowed: Iterable[str],
+        max_labels: int = 3,
+        max_chars: int = 800,
+    ) -> dict:
+        """Revisão, resumo e labels em paralelo (latência da mais lenta, não da soma).
+
+        O diff é condensado uma única vez, no limite do review (mesma entrada de ``review``); o
+        resumo reaproveita esses resumos por arquivo, recortados no seu próprio limite.
+        """
+        condensed = self._condense(diff, _REVIEW_LIMIT)
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            review = ex.submit(self._review_condensed, condensed)
+            summary = ex.submit(self._analyze_summary, condensed, max_chars)
+            labels = ex.submit(self.labels, title, body, diff, allowed, max_labels)
+            return {
+                "review": review.result(),
+                "summary": summary.result(),
+                "labels": labels.result(),
+            }
+
+    async def analyze_async(
+        self,
+        title: str,
+        body: str,
+        diff: str,
+        allowed: Iterable[str],
+        max_labels: int = 3,
+        max_chars: int = 800,
+    ) -> dict:
+        condensed = await self._condense_async(diff, _REVIEW_LIMIT)
+
+        async def summary() -> str:
+            summary_input = self._summary_from_review_input(condensed)
+            if summary_input is None:
+                summary_input = await self._condense_async(condensed, _SUMMARY_LIMIT)
+            text = await self._call_async(self._summary_prompt(summary_input, max_chars))
+            return text[:max_chars]
+
+        review, summary_text, labels = await asyncio.gather(
+            asyncio.to_thread(self._review_condensed, condensed),
+            summary(),
+            self.labels_async(title, body, diff, allowed, max_labels=max_labels),
+        )
+        return {"review": review, "summary": summary_text, "labels": labels}
+
     def labels(
         self,
         title: str,
@@ -81,32 +555,21 @@ class GeminiClient:
         allowed: Iterable[str],
         max_labels: int = 3,
     ) -> list[str]:
-        allow = [a.strip().lower() for a in allowed if a.strip()]
-        allow_str = ", ".join(allow) or "(none)"
-        prompt = (
-            'Classifique o Pull Request. Retorne apenas JSON: {"labels": [..]}. '
-            f"Máx {max_labels} labels. Use somente: {allow_str}. Sem explicações extras.\n\n"
-            f"TITLE: {title}\nBODY:\n{body[:3000]}\nDIFF:\n{diff[:8000]}"
-        )
-        raw = self._call(prompt)
-        # parsing simples
-        out: list[str] = []
-        import json, re  # noqa
+        allow = _normalize_allowed(tuple(allowed))
+        raw = self._call(self._labels_prompt(title, body, diff, allow, max_labels))
+        return self._parse_labels(raw, allow, max_labels)
 
-        match = re.search(r"\{.*\}", raw, flags=re.DOTALL)
-        if match:
-            try:
-                data = json.loads(match.group(0))
-                for x in data.get("labels", []):
-                    if isinstance(x, str):
-                        name = x.lower().strip()
-                        if name in allow and name not in out:
-                            out.append(name)
-                        if len(out) >= max_labels:
-                            break
-            except Exception:  # pragma: no cover
-                pass
-        return out
+    async def labels_async(
+        self,
+        title: str,
+        body: str,
+        diff: str,
+        allowed: Iterable[str],
+        max_labels: int = 3,
+    ) -> list[str]:
+        allow = _normalize_allowed(tuple(allowed))
+        raw = await self._call_async(self._labels_prompt(title, body, diff, allow, max_labels))
+        return self._parse_labels(raw, allow, max_labels)
 
 
 _default_client = GeminiClient()
@@ -122,3 +585,39 @@ def generate_summary(diff: str, max_chars: int = 800) -> str:
 
 def suggest_labels(title: str, body: str, diff: str, allowed: Iterable[str], max_labels: int = 3):
     return _default_client.labels(title, body, diff, allowed, max_labels=max_labels)
+
+
+def analyze_pr(
+    title: str,
+    body: str,
+    diff: str,
+    allowed: Iterable[str],
+    max_labels: int = 3,
+    max_chars: int = 800,
+) -> dict:
+    """Revisão, resumo e labels de um PR em paralelo (latência da mais lenta, não da soma)."""
+    return _default_client.analyze(title, body, diff, allowed, max_labels, max_chars)
+
+
+async def analyze_pr_async(
+    title: str,
+    body: str,
+    diff: str,
+    allowed: Iterable[str],
+    max_labels: int = 3,
+    max_chars: int = 800,
+) -> dict:
+    """Versão assíncrona de ``analyze_pr``; resumo e labels passam pelo agrupamento em lotes."""
+    return await _default_client.analyze_async(title, body, diff, allowed, max_labels, max_chars)
+
+
+async def generate_summary_async(diff: str, max_chars: int = 800) -> str:
+    """Versão assíncrona; chamadas concorrentes são agrupadas em lotes."""
+    return await _default_client.summary_async(diff, max_chars=max_chars)
+
+
+async def suggest_labels_async(
+    title: str, body: str, diff: str, allowed: Iterable[str], max_labels: int = 3
+) -> list[str]:
+    """Versão assíncrona; chamadas concorrentes são agrupadas em lotes."""
+    return await _default_client.labels_async(title, body, diff, allowed, max_labels=max_labels)
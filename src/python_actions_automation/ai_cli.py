@@ -6,18 +6,37 @@ execução isolada sem instalação, mas oferecemos console_script instalado.
 
 from __future__ import annotations
 
-import runpy
+import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
+
+# Módulo do script carregado na primeira chamada; chamadas seguintes não recompilam o arquivo
+_MOD: ModuleType | None = None
+
+
+def _load_script(script_path: Path) -> ModuleType:
+    global _MOD
+    if _MOD is None:
+        spec = importlib.util.spec_from_file_location("gemini_tool", script_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"não foi possível carregar {script_path}")
+        module = importlib.util.module_from_spec(spec)
+        # Registrado antes da execução: dataclasses do script resolvem o próprio módulo
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _MOD = module
+    return _MOD
 
 
 def main() -> int:  # noqa: D401
     script_path = Path(__file__).parent.parent.parent / "scripts" / "gemini_tool.py"
-    # Executa o script real repassando arguments
-    globals_dict = runpy.run_path(str(script_path))  # noqa: S102
-    entry = globals_dict.get("main")
-    if callable(entry):  # type: ignore
-        return int(entry())  # type: ignore
+    # Módulos auxiliares (_llm_cache) ficam ao lado do script
+    if str(script_path.parent) not in sys.path:
+        sys.path.insert(0, str(script_path.parent))
+    entry = getattr(_load_script(script_path), "main", None)
+    if callable(entry):
+        return int(entry())
     print("gemini_tool main não encontrado")
     return 1
 
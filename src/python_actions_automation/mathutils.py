@@ -1,6 +1,44 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Iterable
+from math import fsum
+
+try:  # opcional: extra "fast"
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+# Abaixo disso o custo de despacho do kernel supera o ganho sobre o NumPy
+_NUMBA_MIN_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=1)
+def _normalizar_kernel():  # noqa: ANN202
+    """Kernel Numba (extra "jit") que soma ``a`` e o multiplica pelo inverso, ou None sem Numba.
+
+    Soma e divisão no mesmo laço compilado, no lugar, sem temporário. Importado só na primeira
+    entrada grande (``import python_actions_automation`` não paga o custo do Numba); com
+    ``cache=True`` a compilação fica em disco e não se repete a cada processo.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def kernel(a):  # noqa: ANN001, ANN202
+        total = 0.0
+        for i in range(a.size):
+            total += a[i]
+        if total == 0.0:
+            return total
+        inv = 1.0 / total
+        for i in range(a.size):
+            a[i] *= inv
+        return total
+
+    return kernel
 
 
 def soma(valores: Iterable[float]) -> float:
@@ -9,19 +47,56 @@ def soma(valores: Iterable[float]) -> float:
     Args:
         valores: Iterável de números.
     """
-    total = 0.0
-    for v in valores:
-        total += float(v)
-    return total
+    # fsum soma em C com parciais exatas: mais rápido que o laço em Python e sem perda de precisão.
+    # Lista/tupla de floats dispensa a conversão por elemento.
+    if not (type(valores) in (list, tuple) and (not valores or type(valores[0]) is float)):
+        valores = [float(v) for v in valores]
+    try:
+        return fsum(valores)
+    except (OverflowError, ValueError):
+        # Overflow intermediário ou inf - inf: como a soma comum, devolve inf/nan em vez de falhar
+        return sum(valores, 0.0)
 
 
 def normalizar(valores: Iterable[float]) -> list[float]:
     """Normaliza uma sequência para que a soma seja 1.0.
 
-    Retorna lista vazia se não houver valores ou se soma for zero.
+    Retorna lista vazia se não houver valores ou se soma for zero. Com NumPy o total é a soma do
+    array (em pares) e, sem ele, ``fsum``: os resultados coincidem a menos de arredondamento.
     """
+    if np is not None:
+        return normalizar_np(valores).tolist()
     lista = [float(v) for v in valores]
-    total = soma(lista)
-    if total == 0 or not lista:
+    if not lista:
+        return []
+    total = soma(lista)  # já convertidos: uma passada em C, sem novo float() por elemento
+    if total == 0.0:
         return []
     return [v / total for v in lista]
+
+
+def normalizar_np(valores: Iterable[float]) -> np.ndarray:
+    """Como ``normalizar``, mas devolve um ``numpy.ndarray`` (float64 contíguo).
+
+    Preferível quando o resultado segue para mais contas: soma e divisão rodam sobre o buffer, sem
+    ``tolist()`` no fim. Um ``ndarray`` de entrada é copiado em bloco, sem ser percorrido elemento a
+    elemento. Requer NumPy (extra ``fast``).
+    """
+    if np is None:
+        raise ImportError(
+            "normalizar_np requer numpy: pip install python-actions-automation-demo[fast]"
+        )
+    if isinstance(valores, np.ndarray):
+        arr = np.array(valores, dtype=np.float64)  # cópia: a divisão abaixo é no lugar
+    else:
+        arr = np.fromiter(valores, dtype=np.float64)
+    kernel = _normalizar_kernel() if arr.size > _NUMBA_MIN_SIZE else None
+    if kernel is not None:
+        return arr if kernel(arr) != 0 else np.empty(0, dtype=np.float64)
+    # inf/nan propagam sem aviso, como em ``soma`` e no caminho sem NumPy
+    with np.errstate(over="ignore", invalid="ignore"):
+        total = arr.sum()
+        if arr.size == 0 or total == 0:
+            return np.empty(0, dtype=np.float64)
+        arr /= total  # buffer novo (cópia/fromiter): divide no lugar, sem temporário
+    return arr
@@ -1,12 +1,24 @@
+import asyncio
+import contextlib
 import os
 
-from python_actions_automation.ai import generate_summary, suggest_labels
+from python_actions_automation.ai import (
+    GeminiClient,
+    analyze_pr,
+    analyze_pr_async,
+    core,
+    generate_summary,
+    reset_ai_config,
+    suggest_labels,
+)
+from python_actions_automation.ai.core import _extract_json_object
 
 
 def test_generate_summary_no_key():
     # Sem chave deve retornar uma string não vazia (fallback neutro permitido)
     if "GEMINI_API_KEY" in os.environ:
         del os.environ["GEMINI_API_KEY"]
+    reset_ai_config()
     out = generate_summary("diff exemplo")
     assert isinstance(out, str)
     assert out  # algo retornado
@@ -15,6 +27,178 @@ def test_generate_summary_no_key():
 def test_suggest_labels_fallback():
     if "GEMINI_API_KEY" in os.environ:
         del os.environ["GEMINI_API_KEY"]
+    reset_ai_config()
     labels = suggest_labels("Title", "Body", "diff", ["bug", "tests"])
     # Sem chave não deve quebrar; pode retornar vazio
     assert isinstance(labels, list)
+
+
+def test_extract_json_object():
+    raw = 'Resposta: {"labels": ["bug", "a}b"]} e depois {"x": 1}'
+    assert _extract_json_object(raw) == '{"labels": ["bug", "a}b"]}'
+    assert _extract_json_object("sem json") is None
+    assert _extract_json_object('{"labels": [') is None
+
+
+def test_parse_labels_com_texto_apos_o_json():
+    allow = frozenset({"bug", "tests"})
+    assert GeminiClient._parse_labels('{"labels": ["Bug"]}', allow, 3) == ["bug"]
+    raw = 'ok {"labels": ["tests", "x"]} nota: {veja}'
+    assert GeminiClient._parse_labels(raw, allow, 3) == ["tests"]
+    assert GeminiClient._parse_labels("sem json", allow, 3) == []
+
+
+class _FakeModel:
+    model_name = "models/fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        return type("Resp", (), {"text": f"resposta {self.calls}"})()
+
+    async def generate_content_async(self, prompt):
+        return self.generate_content(prompt)
+
+
+def test_call_usa_cache_em_disco(monkeypatch, tmp_path):
+    model = _FakeModel()
+    monkeypatch.setattr(core, "_ensure_client", lambda: model)
+    monkeypatch.setattr(core, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(core, "_CACHE_TTL", 60)
+    client = GeminiClient()
+    assert client._call("prompt") == "resposta 1"
+    assert client._call("prompt") == "resposta 1"
+    assert model.calls == 1
+    # Com TTL 0 o cache fica desativado e o modelo volta a ser chamado
+    monkeypatch.setattr(core, "_CACHE_TTL", 0)
+    assert client._call("prompt") == "resposta 2"
+
+
+def test_cache_em_disco_apaga_respostas_expiradas(monkeypatch, tmp_path):
+    monkeypatch.setattr(core, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(core, "_CACHE_TTL", 60)
+    velho = tmp_path / "velho.txt"
+    velho.write_text("antiga", encoding="utf-8")
+    os.utime(velho, (0, 0))
+    core._cache_put(tmp_path / "novo.txt", "nova")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["novo.txt"]
+
+
+def test_chamadas_async_concorrentes_formam_um_lote(monkeypatch, tmp_path):
+    model = _FakeModel()
+    monkeypatch.setattr(core, "_ensure_client", lambda: model)
+    monkeypatch.setattr(core, "_CACHE_DIR", tmp_path)
+    client = GeminiClient()
+    batches = []
+    run = client._batcher._run
+
+    async def spy(batch):
+        batches.append(len(batch))
+        await run(batch)
+
+    monkeypatch.setattr(client._batcher, "_run", spy)
+
+    async def main():
+        return await asyncio.gather(*(client.summary_async(f"diff {i}") for i in range(3)))
+
+    out = asyncio.run(main())
+    assert sorted(out) == ["resposta 1", "resposta 2", "resposta 3"]
+    assert batches == [3]
+
+
+def test_falha_inesperada_no_lote_nao_deixa_chamadores_pendentes(monkeypatch):
+    def boom():
+        raise RuntimeError("sdk quebrado")
+
+    monkeypatch.setattr(core, "_ensure_client", boom)
+    client = GeminiClient()
+
+    async def main():
+        calls = (client.summary_async(f"diff {i}") for i in range(2))
+        return await asyncio.wait_for(asyncio.gather(*calls), timeout=1)
+
+    out = asyncio.run(main())
+    assert all(o.startswith("(falha na geração: sdk quebrado") for o in out)
+
+
+def test_lote_nao_trava_apos_loop_encerrado_com_timer_pendente(monkeypatch, tmp_path):
+    monkeypatch.setattr(core, "_ensure_client", lambda: _FakeModel())
+    monkeypatch.setattr(core, "_CACHE_DIR", tmp_path)
+    client = GeminiClient()
+
+    async def abandona():
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(client.summary_async("x"), 0.001)
+
+    asyncio.run(abandona())  # loop fecha antes do timer de 20 ms
+    out = asyncio.run(asyncio.wait_for(client.summary_async("y"), timeout=1))
+    assert not out.startswith("(falha")
+
+
+def _big_diff(n_files, body_chars):
+    return "".join(
+        f"diff --git a/m{i}.py b/m{i}.py\n+" + "x" * body_chars + "\n" for i in range(n_files)
+    )
+
+
+def test_summary_condensa_diff_grande_por_arquivo(monkeypatch, tmp_path):
+    model = _FakeModel()
+    prompts = []
+    generate = model.generate_content
+    monkeypatch.setattr(model, "generate_content", lambda p: prompts.append(p) or generate(p))
+    monkeypatch.setattr(core, "_ensure_client", lambda: model)
+    monkeypatch.setattr(core, "_CACHE_DIR", tmp_path)
+    diff = "diff --git a/x.py b/x.py\n+x\ndiff --git a/y.py b/y.py\n+y\n"
+    assert core._split_diff_by_file(diff)[1] == "diff --git a/y.py b/y.py\n+y"
+    # 300 arquivos: agrupados em trechos e limitados ao orçamento do prompt final
+    GeminiClient().summary(_big_diff(300, 2000))
+    max_calls = core._SUMMARY_LIMIT // core._SUMMARY_CHARS_PER_CALL
+    assert model.calls == max_calls + 1
+    assert "RESUMOS POR ARQUIVO" in prompts[-1]
+    assert "Arquivos não resumidos: " in prompts[-1]
+    # Arquivos pequenos dividem a mesma chamada
+    assert prompts[0].count("diff --git") == 3
+
+
+def test_analyze_pr_sem_chave():
+    if "GEMINI_API_KEY" in os.environ:
+        del os.environ["GEMINI_API_KEY"]
+    reset_ai_config()
+    for out in (
+        analyze_pr("T", "B", "diff", ["bug"]),
+        asyncio.run(analyze_pr_async("T", "B", "diff", ["bug"])),
+    ):
+        assert set(out) == {"review", "summary", "labels"}
+        assert out["labels"] == []
+
+
+def test_analyze_pr_condensa_uma_vez(monkeypatch, tmp_path):
+    model = _FakeModel()
+    prompts = []
+    generate = model.generate_content
+    monkeypatch.setattr(model, "generate_content", lambda p: prompts.append(p) or generate(p))
+    monkeypatch.setattr(core, "_ensure_client", lambda: model)
+    monkeypatch.setattr(core, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(core, "_CACHE_TTL", 0)  # sem cache: duplicatas apareceriam como chamadas
+    analyze_pr("T", "B", _big_diff(200, 2000), ["bug"])
+    assert len(prompts) == len(set(prompts))
+    file_calls = [p for p in prompts if p.startswith(core._FILE_SUMMARY_PREFIX)]
+    assert len(file_calls) == core._REVIEW_LIMIT // core._SUMMARY_CHARS_PER_CALL
+
+
+def test_analyze_pr_revisa_o_mesmo_diff_que_generate_review(monkeypatch, tmp_path):
+    model = _FakeModel()
+    prompts = []
+    generate = model.generate_content
+    monkeypatch.setattr(model, "generate_content", lambda p: prompts.append(p) or generate(p))
+    monkeypatch.setattr(core, "_ensure_client", lambda: model)
+    monkeypatch.setattr(core, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(core, "_CACHE_TTL", 0)
+    diff = _big_diff(10, 1500)  # entre o limite do resumo e o do review
+    assert core._SUMMARY_LIMIT < len(diff) < core._REVIEW_LIMIT
+    analyze_pr("T", "B", diff, ["bug"])
+    review_prompts = [p for p in prompts if p.startswith(core._REVIEW_PREFIX)]
+    assert review_prompts == [core._REVIEW_PREFIX + "\n\n" + core._normalize_tail(diff)]
+    assert any(p.startswith(core._FILE_SUMMARY_PREFIX) for p in prompts)  # resumo condensado
@@ -0,0 +1,48 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import format_markdown_code_blocks as fmt  # noqa: E402
+
+
+def _blocks(text):
+    return list(fmt.iter_blocks(text.split("\n")))
+
+
+def test_iter_blocks_pula_outras_linguagens():
+    text = "```js\nx\n```\n```python\ny = 1\n```\n```\nsem lang\n```\n```sh\necho\n```\n"
+    assert _blocks(text) == [(3, 5, "python"), (9, 11, "sh")]
+
+
+def test_iter_blocks_cerca_sem_fechamento_encerra_a_busca():
+    text = "```python\na = 1\n```\n```bash\necho sem fim\n```python\nb = 2\n"
+    assert _blocks(text) == [(0, 2, "python")]
+
+
+def test_iter_blocks_fechamento_precisa_de_linha_propria():
+    # ``` no fim de uma linha de código não fecha o bloco
+    assert _blocks("```python\ns = '```'\n```\n") == [(0, 2, "python")]
+
+
+def test_extract_e_splice_bloco_vazio_e_sem_newline_final(tmp_path):
+    md = tmp_path / "doc.md"
+    md.write_text("# T\n```python\n```\ntexto\n```python\nx=1\n```", encoding="utf-8")
+    assert fmt.extract_blocks(md) == [("python", "\n"), ("python", "x=1\n")]
+    assert fmt.splice_blocks(md, ["", "x = 1"])
+    assert md.read_text(encoding="utf-8") == "# T\n```python\n```\ntexto\n```python\nx = 1\n```"
+    assert not fmt.splice_blocks(md, ["", "x = 1"])
+
+
+def test_format_batch_bloco_invalido_nao_impede_os_demais(monkeypatch, tmp_path):
+    if shutil.which("ruff") is None:
+        pytest.skip("ruff não instalado")
+    monkeypatch.setattr(fmt, "CACHE_DIR", tmp_path / "cache")
+    blocks = [("python", "x=1\n"), ("python", "def (:\n"), ("python", "y  =  2\n")]
+    assert fmt.format_batch(blocks) == ["x = 1", "def (:", "y = 2"]
+    # O bloco inválido (saída igual à entrada, ruff com erro) não entra no cache
+    assert fmt.cache_get(".py", "def (:\n") is None
+    assert fmt.cache_get(".py", "x=1\n") == "x = 1"
@@ -0,0 +1,7 @@
+import python_actions_automation
+
+
+def test_public_api():
+    assert python_actions_automation.__all__ == ["normalizar", "normalizar_np", "soma"]
+    for name in python_actions_automation.__all__:
+        assert callable(getattr(python_actions_automation, name))
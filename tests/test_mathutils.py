@@ -1,10 +1,26 @@
-from python_actions_automation import normalizar, soma
+import math
+import random
+
+import pytest
+
+from python_actions_automation import mathutils, normalizar, normalizar_np, soma
 
 
 def test_soma():
     assert soma([1, 2, 3]) == 6
 
 
+def test_soma_precisao():
+    # Soma ingênua daria 0.9999999999999999
+    assert soma([0.1] * 10) == 1.0
+
+
+def test_soma_overflow_e_inf_como_soma_comum():
+    assert soma([1e308, 1e308]) == math.inf
+    assert math.isnan(soma([math.inf, -math.inf]))
+    assert normalizar([1e308, 1e308]) == [0.0, 0.0]
+
+
 def test_normalizar_empty():
     assert normalizar([]) == []
 
@@ -13,3 +29,34 @@ def test_normalizar():
     result = normalizar([2, 2, 4])
     # Soma = 8, valores normalizados devem ser [0.25, 0.25, 0.5]
     assert result == [0.25, 0.25, 0.5]
+
+
+def test_normalizar_np():
+    np = pytest.importorskip("numpy")
+    result = normalizar_np([2, 2, 4])
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [0.25, 0.25, 0.5]
+    assert normalizar_np([0, 0]).size == 0
+    entrada = np.array([1, 3], dtype=np.int64)
+    assert normalizar_np(entrada).tolist() == [0.25, 0.75]
+    assert entrada.tolist() == [1, 3]  # a entrada não é alterada
+
+
+def test_normalizar_mesmo_resultado_com_e_sem_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(0)
+    casos = [[rng.uniform(-1, 10) for _ in range(rng.randint(1, 50))] for _ in range(2000)]
+    com_numpy = [normalizar(c) for c in casos]
+    monkeypatch.setattr(mathutils, "np", None)
+    for caso, esperado in zip(casos, com_numpy, strict=True):
+        assert normalizar(caso) == pytest.approx(esperado, rel=1e-12, abs=1e-15)
+
+
+def test_kernel_numba_proximo_do_numpy(monkeypatch):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    valores = np.random.default_rng(0).uniform(0, 10, mathutils._NUMBA_MIN_SIZE + 1000)
+    com_kernel = normalizar_np(valores)
+    assert normalizar_np(np.zeros(len(valores))).size == 0
+    monkeypatch.setattr(mathutils, "_NUMBA_MIN_SIZE", len(valores))
+    assert com_kernel.tolist() == pytest.approx(normalizar_np(valores).tolist(), rel=1e-12)